@@ -7,7 +7,10 @@ from datetime import datetime
 import pandas as pd
 from arxiv_downloader import ArxivDownloader
 from pdf_processor import PDFProcessor
+from extraction_cache import ExtractionCache
 from chroma_manager import ChromaManager
+from search_filter import SearchFilter
+from embeddings import create_embedding_function
 
 # PDF silme fonksiyonu
 def delete_pdf(file_path):
@@ -22,17 +25,52 @@ def delete_pdf(file_path):
         print(f"Silme hatası: {e}")
         return False
 
+# Ekleme sonuçları için notlar: kısmen çıkarılan belgeler ve temizleme kazancı
+def show_ingest_notes(results):
+    added = [result for result in results if result["success"]]
+    partial = [
+        result for result in added
+        if result.get("extraction_status", "complete") != "complete"
+    ]
+    if partial:
+        st.warning(f"{len(partial)} belge sayfa veya süre sınırı nedeniyle kısmen eklendi.")
+    
+    cleanups = [result["cleanup"] for result in added if result.get("cleanup")]
+    if cleanups:
+        chars_saved = sum(cleanup["chars_saved"] for cleanup in cleanups)
+        chunks_saved = sum(cleanup["chunks_saved"] for cleanup in cleanups)
+        st.caption(f"Kaynakça ve üst/alt bilgiler atlandı: {chars_saved} karakter, yaklaşık {chunks_saved} parça.")
+    
+    flagged = [result for result in added if result["metadata"].get("near_duplicate_of")]
+    if flagged:
+        st.warning(f"{len(flagged)} belgenin başı kayıtlı bir belgeninkine çok benziyor; belgeler yakın kopya olarak işaretlendi.")
+
 # Sabit değişkenler
 DATA_DIR = "./data"
 DOWNLOAD_DIR = os.path.join(DATA_DIR, "downloads")
+EXTRACTION_CACHE_DIR = os.path.join(DATA_DIR, "extraction_cache")
 DB_PATH = "./chroma_data"
 COLLECTION_NAME = "knowledge"  # Tek koleksiyon adı
+MAX_PDF_PAGES = 1000  # Belge başına okunacak en fazla sayfa
+PDF_EXTRACT_TIMEOUT = 120  # Belge başına metin çıkarma süresi (saniye)
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "onnx")  # "onnx" veya çevrimdışı "hashing"
+EMBEDDING_BATCH_SIZE = 32  # Modelin tek seferde işlediği parça sayısı
+EMBEDDING_THREADS = None  # ONNX Runtime iş parçacığı sayısı (None: varsayılan)
+NEAR_DUPLICATE_THRESHOLD = 0.85  # Yakın kopya sayılan en düşük Jaccard benzerliği
+NEAR_DUPLICATE_ACTION = "flag"  # "skip" (ekleme), "flag" (işaretleyip ekle) veya None; benzerlik belgelerin başından tahmin edilir
 
 # Dizinleri oluştur
-for directory in [DATA_DIR, DOWNLOAD_DIR, DB_PATH]:
+for directory in [DATA_DIR, DOWNLOAD_DIR, EXTRACTION_CACHE_DIR, DB_PATH]:
     if not os.path.exists(directory):
         os.makedirs(directory)
 
+# Çıkarılan metin ve metadata'yı diskte önbelleğe al (tüm PDFProcessor örnekleri kullanır)
+PDFProcessor.cache = ExtractionCache(EXTRACTION_CACHE_DIR)
+
+# Bozuk veya aşırı büyük PDF'lerin işlemi kilitlemesini önle
+PDFProcessor.max_pages = MAX_PDF_PAGES
+PDFProcessor.timeout = PDF_EXTRACT_TIMEOUT
+
 # Streamlit sayfa yapılandırması
 st.set_page_config(
     page_title="Chroma PDF Manager",
@@ -59,18 +97,43 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # PDF görüntüleyici için yardımcı fonksiyon
-def get_pdf_download_link(file_path):
+def get_pdf_download_link(file_path, data=None):
     try:
-        with open(file_path, "rb") as f:
-            base64_pdf = base64.b64encode(f.read()).decode('utf-8')
+        if data is None:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        base64_pdf = base64.b64encode(data).decode('utf-8')
         return f'<a href="data:application/pdf;base64,{base64_pdf}" download="{os.path.basename(file_path)}" style="display: inline-block; padding: 8px 16px; background-color: #4CAF50; color: white; text-decoration: none; border-radius: 4px;">PDF\'i İndir</a>'
     except Exception as e:
         st.error(f"PDF indirme hatası: {e}")
         return None
 
+# Yüklenen PDF'i indirme dizinine kaydeden yardımcı fonksiyon (yalnızca kullanıcı onaylayınca)
+def save_uploaded_pdf(uploaded_file):
+    file_path = os.path.join(DOWNLOAD_DIR, uploaded_file.name)
+    with open(file_path, "wb") as f:
+        f.write(uploaded_file.getbuffer())
+    return file_path
+
 # Sınıf örneklerini oluştur
 arxiv_downloader = ArxivDownloader(save_dir=DOWNLOAD_DIR)
-chroma_manager = ChromaManager(db_path=DB_PATH)
+
+# Chroma yöneticisi tüm oturumlarda ve yeniden çalıştırmalarda tek örnek olarak paylaşılır (arama önbelleği dahil)
+@st.cache_resource
+def get_chroma_manager():
+    manager = ChromaManager(
+        db_path=DB_PATH,
+        embedding_function=create_embedding_function(
+            EMBEDDING_BACKEND,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            threads=EMBEDDING_THREADS
+        )
+    )
+    manager.near_duplicate_threshold = NEAR_DUPLICATE_THRESHOLD
+    manager.near_duplicate_action = NEAR_DUPLICATE_ACTION
+    return manager
+
+chroma_manager = get_chroma_manager()
 
 # Yan menü
 with st.sidebar:
@@ -92,8 +155,25 @@ with st.sidebar:
         if stats['collections']:
             st.write(f"Koleksiyon: {COLLECTION_NAME}")
             st.write(f"İçerik: {stats['collection_stats'].get(COLLECTION_NAME, {}).get('count', 0)} belge")
+            st.write(f"Bölümler: {stats.get('total_chunks', 0)} ({stats.get('text_bytes', 0) / (1024 * 1024):.1f} MB metin)")
+            if stats.get("sources"):
+                st.write("Kaynaklar: " + ", ".join(
+                    f"{source or 'belirtilmemiş'} ({count})" for source, count in sorted(stats["sources"].items())
+                ))
+            if "embedding_cache" in stats:
+                cache_stats = stats["embedding_cache"]
+                st.write(f"Embedding önbelleği: {cache_stats['entries']} kayıt ({cache_stats['hits']} isabet / {cache_stats['misses']} hesaplama)")
+            if "query_cache" in stats:
+                query_stats = stats["query_cache"]
+                st.write(f"Arama önbelleği: {query_stats['entries']} kayıt ({query_stats['hits']} isabet / {query_stats['misses']} sorgu)")
         else:
             st.warning("Henüz koleksiyon bulunmuyor.")
+        
+        # Sayaçlar koleksiyonla uyuşmazsa (ör. dışarıdan yapılan değişiklikler)
+        if st.button("İstatistikleri yeniden hesapla"):
+            with st.spinner("Koleksiyon taranıyor..."):
+                chroma_manager.rebuild_catalog()
+            st.experimental_rerun()
     except Exception as e:
         st.error(f"Veritabanı durumu alınamadı: {e}")
     
@@ -139,15 +219,16 @@ if page == "Ana Sayfa":
     st.subheader("Son Eklenen Makaleler")
     
     try:
-        latest_docs = chroma_manager.get_all_documents(limit=5)
+        latest_docs = chroma_manager.latest(5)
         
-        if latest_docs["total"] > 0:
+        if latest_docs["ids"]:
             for i, (doc_id, metadata) in enumerate(zip(latest_docs["ids"], latest_docs["metadatas"])):
-                with st.expander(f"{i+1}. {metadata.get('title', 'Başlıksız')}"):
+                added_at = metadata.get("added_at")
+                with st.expander(f"{i+1}. {metadata.get('title') or 'Başlıksız'}"):
                     st.write(f"**ID:** {doc_id}")
-                    st.write(f"**Yazarlar:** {metadata.get('author', metadata.get('authors', 'Belirtilmemiş'))}")
-                    st.write(f"**Eklenme Tarihi:** {metadata.get('added_date', 'Belirtilmemiş')}")
-                    st.write(f"**Kaynak:** {metadata.get('source', 'Manuel yükleme')}")
+                    st.write(f"**Yazarlar:** {metadata.get('author') or 'Belirtilmemiş'}")
+                    st.write(f"**Eklenme Tarihi:** {datetime.fromtimestamp(added_at).strftime('%Y-%m-%d %H:%M') if added_at else 'Belirtilmemiş'}")
+                    st.write(f"**Kaynak:** {metadata.get('source') or 'Manuel yükleme'}")
         else:
             st.info("Henüz veritabanına eklenmiş makale bulunmuyor.")
     except Exception as e:
@@ -223,7 +304,7 @@ elif page == "ArXiv İndirici":
                     st.session_state.arxiv_papers = papers
                     st.session_state.total_papers = total_count
                     st.success(f"Sayfa {st.session_state.current_page + 1} için {len(papers)} makale bulundu.")
-                    
+            
             except Exception as e:
                 st.error(f"Arama sırasında hata oluştu: {str(e)}")
                 st.info("Lütfen daha sonra tekrar deneyin veya farklı arama kriterleri kullanın.")
@@ -306,33 +387,40 @@ elif page == "ArXiv İndirici":
                             progress_bar = st.progress(0)
                             status_text = st.empty()
                             
-                            added = []
+                            # Önce indir (API limitleri nedeniyle sırayla)
+                            file_paths = []
+                            metadatas = []
                             for i, paper in enumerate(st.session_state.arxiv_papers):
-                                status_text.text(f"Ekleniyor: {paper['title']}")
+                                status_text.text(f"İndiriliyor: {paper['title']}")
                                 
-                                # Önce indir
                                 file_path = arxiv_downloader.download_paper(paper)
                                 if file_path:
+                                    file_paths.append(file_path)
                                     # Metadata hazırla
-                                    metadata = {
+                                    metadatas.append({
                                         "title": paper["title"],
                                         "author": ", ".join(paper["authors"]),
                                         "summary": paper["summary"][:500],
                                         "published": paper["published"].strftime("%Y-%m-%d"),
                                         "arxiv_id": paper["arxiv_id"],
+                                        "categories": paper["categories"],
                                         "source": "arxiv"
-                                    }
-                                    
-                                    # Veritabanına ekle
-                                    result = chroma_manager.add_pdf(file_path, metadata)
-                                    if result["success"]:
-                                        added.append(paper)
+                                    })
                                 
-                                progress_bar.progress((i + 1) / len(st.session_state.arxiv_papers))
+                                progress_bar.progress((i + 1) / len(st.session_state.arxiv_papers) / 2)
                                 time.sleep(1)  # API limitleri için bekleme
                             
+                            # Sonra tüm çekirdekleri kullanarak veritabanına ekle
+                            def on_progress(done, total, result):
+                                status_text.text(f"Ekleniyor: {done}/{total}")
+                                progress_bar.progress(0.5 + done / total / 2)
+                            
+                            results = chroma_manager.add_pdfs(file_paths, metadatas, progress_callback=on_progress)
+                            added = [result for result in results if result["success"]]
+                            
                             status_text.text(f"{len(added)} makale veritabanına eklendi.")
                             st.success(f"{len(added)} makale başarıyla veritabanına eklendi.")
+                            show_ingest_notes(results)
                     with col2:
                         if st.button("Kapat", key="cancel_add_all_to_db"):
                             st.info("İşlem iptal edildi.")
@@ -401,6 +489,7 @@ elif page == "ArXiv İndirici":
                                         "summary": paper["summary"][:500],
                                         "published": paper["published"].strftime("%Y-%m-%d"),
                                         "arxiv_id": paper["arxiv_id"],
+                                        "categories": paper["categories"],
                                         "source": "arxiv"
                                     }
                                     
@@ -408,6 +497,7 @@ elif page == "ArXiv İndirici":
                                     
                                     if result["success"]:
                                         st.success("Veritabanına eklendi!")
+                                        show_ingest_notes([result])
                                     else:
                                         st.error(f"Ekleme hatası: {result['error']}")
                         else:
@@ -435,9 +525,8 @@ elif page == "İndirilen PDF'ler":
             if file.endswith(".pdf"):
                 file_path = os.path.join(DOWNLOAD_DIR, file)
                 try:
-                    # PDF işleyici başlat
-                    processor = PDFProcessor(file_path)
-                    metadata = processor.extract_metadata()
+                    # Sadece bilgi sözlüğü ve ilk sayfayı oku (tam metin gerekmiyor)
+                    metadata = PDFProcessor(file_path).extract_metadata(fast=True, timeout=2)
                     
                     st.session_state.downloaded_pdfs.append({
                         "file_name": file,
@@ -482,26 +571,30 @@ elif page == "İndirilen PDF'ler":
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    added = []
-                    for i, pdf in enumerate(selected_pdfs):
-                        status_text.text(f"Ekleniyor: {pdf['title']}")
-                        # Basitleştirilmiş metadata
-                        metadata = {
+                    # Basitleştirilmiş metadata
+                    metadatas = [
+                        {
                             "title": pdf["title"],
                             "author": pdf["authors"],
                             "source": "download_folder"
                         }
-                        
-                        result = chroma_manager.add_pdf(pdf["file_path"], metadata)
-                        
-                        if result["success"]:
-                            added.append(pdf)
-                        
-                        progress_bar.progress((i + 1) / len(selected_pdfs))
-                        time.sleep(0.5)  # API limitleri için bekleme
+                        for pdf in selected_pdfs
+                    ]
+                    
+                    def on_progress(done, total, result):
+                        status_text.text(f"Ekleniyor: {done}/{total}")
+                        progress_bar.progress(done / total)
+                    
+                    results = chroma_manager.add_pdfs(
+                        [pdf["file_path"] for pdf in selected_pdfs],
+                        metadatas,
+                        progress_callback=on_progress
+                    )
+                    added = [result for result in results if result["success"]]
                     
                     status_text.text(f"{len(added)} PDF veritabanına eklendi.")
                     st.success(f"{len(added)} PDF başarıyla veritabanına eklendi.")
+                    show_ingest_notes(results)
         
         with col3:
             if st.button("Seçili PDF'leri Sil", key="delete_selected_pdfs"):
@@ -569,6 +662,7 @@ elif page == "İndirilen PDF'ler":
                                 
                                 if result["success"]:
                                     st.success("Veritabanına eklendi!")
+                                    show_ingest_notes([result])
                                 else:
                                     st.error(f"Ekleme hatası: {result['error']}")
                     
@@ -592,15 +686,38 @@ elif page == "Ayrıca PDF Ekle":
     if uploaded_files:
         st.subheader("Yüklenen PDF'ler")
         
-        for i, uploaded_file in enumerate(uploaded_files):
-            # PDF'i indirme dizinine kaydet
-            file_path = os.path.join(DOWNLOAD_DIR, uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getvalue())
+        # Tüm yüklenenleri tek seferde ekle (başlık/yazar alanlarındaki düzenlemelerle)
+        if st.button("Tümünü Veritabanına Ekle", key="add_all_uploads", type="primary"):
+            progress_bar = st.progress(0)
+            status_text = st.empty()
             
-            # PDF'i işle
-            processor = PDFProcessor(file_path)
-            metadata = processor.extract_metadata()
+            def on_progress(done, total, result):
+                status_text.text(f"Ekleniyor: {done}/{total}")
+                progress_bar.progress(done / total)
+            
+            # Kullanıcı onayladı, dosyaları kalıcı hale getir
+            file_paths = [save_uploaded_pdf(uploaded_file) for uploaded_file in uploaded_files]
+            metadatas = []
+            for i, uploaded_file in enumerate(uploaded_files):
+                metadata = {"source": "manual_upload"}
+                if f"title_{i}" in st.session_state:
+                    metadata["title"] = st.session_state[f"title_{i}"]
+                if f"authors_{i}" in st.session_state:
+                    metadata["author"] = st.session_state[f"authors_{i}"]
+                metadatas.append(metadata)
+            
+            results = chroma_manager.add_pdfs(file_paths, metadatas, progress_callback=on_progress)
+            added = [result for result in results if result["success"]]
+            status_text.text(f"{len(added)} PDF veritabanına eklendi.")
+            st.success(f"{len(added)} PDF başarıyla veritabanına eklendi.")
+            show_ingest_notes(results)
+        
+        for i, uploaded_file in enumerate(uploaded_files):
+            # Yüklenen içeriği diske yazmadan ve kopyalamadan doğrudan işle;
+            # önizleme ve veritabanına ekleme aynı sonucu kullanır
+            buffer = uploaded_file.getbuffer()
+            parsed = PDFProcessor(buffer, name=uploaded_file.name).parse()
+            metadata = parsed["metadata"]
             
             with st.expander(f"{uploaded_file.name}"):
                 col1, col2 = st.columns(2)
@@ -621,16 +738,19 @@ elif page == "Ayrıca PDF Ekle":
                             }
                             
                             # Veritabanına ekle
-                            result = chroma_manager.add_pdf(file_path, updated_metadata)
+                            result = chroma_manager.add_pdf(buffer, updated_metadata, parsed=parsed, file_name=uploaded_file.name)
                             
                             if result["success"]:
+                                # Kullanıcı onayladı, dosyayı kalıcı hale getir
+                                save_uploaded_pdf(uploaded_file)
                                 st.success("Veritabanına eklendi!")
+                                show_ingest_notes([result])
                             else:
                                 st.error(f"Ekleme hatası: {result['error']}")
                 
                 with col2:
                     st.write("**İçerik Önizleme**")
-                    text = processor.extract_text()
+                    text = parsed["text"]
                     if text:
                         st.text_area("Metin Önizleme", value=text[:1000] + "...", height=300, key=f"preview_{i}")
                     else:
@@ -638,7 +758,7 @@ elif page == "Ayrıca PDF Ekle":
                     
                     # PDF görüntüleme butonu
                     if st.button(f"PDF'i İndir #{i}"):
-                        st.markdown(get_pdf_download_link(file_path), unsafe_allow_html=True)
+                        st.markdown(get_pdf_download_link(uploaded_file.name, data=buffer), unsafe_allow_html=True)
 
 
 # Veritabanı Yönetimi
@@ -650,8 +770,16 @@ elif page == "Veritabanı Yönetimi":
     with tabs[0]:  # Belge Listesi
         st.subheader("Veritabanındaki Belgeler")
         
-        # Sayfalama
+        # Sayfalama ve sıralama
         page_size = st.slider("Sayfa Başına Belge", min_value=5, max_value=50, value=10, step=5)
+        sort_options = {
+            "Eklenme tarihi (yeni → eski)": ("added_at", True),
+            "Eklenme tarihi (eski → yeni)": ("added_at", False),
+            "Başlık": ("title", False),
+            "Yazar": ("author", False),
+            "Bölüm sayısı": ("chunk_count", True)
+        }
+        order_by, descending = sort_options[st.selectbox("Sıralama", list(sort_options))]
         
         if "doc_page" not in st.session_state:
             st.session_state.doc_page = 0
@@ -664,56 +792,61 @@ elif page == "Veritabanı Yönetimi":
             if st.button("Sonraki Sayfa"):
                 st.session_state.doc_page += 1
         
-        offset = st.session_state.doc_page * page_size
-        
-        # Belgeleri getir
+        # Belgeleri katalogdan getir (yalnızca bu sayfa)
         docs = chroma_manager.get_all_documents(
             limit=page_size,
-            offset=offset
+            offset=st.session_state.doc_page * page_size,
+            order_by=order_by,
+            descending=descending
         )
-        
-        # Chunk'ları grupla ve ana belgeleri bul
-        main_documents = {}
-        for i, (doc_id, metadata) in enumerate(zip(docs["ids"], docs["metadatas"])):
-            # Chunk ID'sini kontrol et
-            if '_chunk_' in doc_id:
-                main_id = doc_id.split('_chunk_')[0]
-                if main_id not in main_documents:
-                    main_documents[main_id] = {
-                        'id': main_id,
-                        'metadata': metadata.copy(),
-                        'chunks': []
-                    }
-                main_documents[main_id]['chunks'].append(doc_id)
-            else:
-                main_documents[doc_id] = {
-                    'id': doc_id,
-                    'metadata': metadata,
-                    'chunks': []
-                }
-        
-        total_docs = len(main_documents)
+        total_docs = docs["total"]
         total_pages = (total_docs + page_size - 1) // page_size if total_docs > 0 else 1
+        
+        # Son sayfanın ötesine geçildiyse son sayfayı göster
+        if st.session_state.doc_page >= total_pages:
+            st.session_state.doc_page = total_pages - 1
+            docs = chroma_manager.get_all_documents(
+                limit=page_size,
+                offset=st.session_state.doc_page * page_size,
+                order_by=order_by,
+                descending=descending
+            )
+        
         st.write(f"Sayfa {st.session_state.doc_page + 1}/{max(1, total_pages)} (Toplam {total_docs} belge)")
         
         if total_docs == 0:
             st.info(f"Koleksiyonda '{COLLECTION_NAME}' henüz belge bulunmuyor.")
         else:
+            # Toplu silme (bu sayfadaki belgelerden seçilenler)
+            titles = {
+                doc_id: metadata.get("title") or doc_id
+                for doc_id, metadata in zip(docs["ids"], docs["metadatas"])
+            }
+            selected_ids = st.multiselect(
+                "Silinecek belgeler",
+                docs["ids"],
+                format_func=lambda doc_id: titles[doc_id],
+                key=f"bulk_delete_{st.session_state.doc_page}"
+            )
+            if selected_ids and st.button(f"Seçilen {len(selected_ids)} belgeyi sil"):
+                if chroma_manager.delete_documents(selected_ids):
+                    st.success(f"{len(selected_ids)} belge ve tüm bölümleri silindi.")
+                    st.experimental_rerun()
+                else:
+                    st.error("Belgeler silinemedi. Lütfen tekrar deneyin.")
+            
             # Belgeleri listele
-            doc_list = list(main_documents.values())[offset:offset+page_size]
-            for i, doc_info in enumerate(doc_list):
-                doc_id = doc_info['id']
-                metadata = doc_info['metadata']
-                with st.expander(f"📄 {metadata.get('title', 'Başlıksız')}", expanded=False):
+            for doc_id, metadata in zip(docs["ids"], docs["metadatas"]):
+                with st.expander(f"📄 {metadata.get('title') or 'Başlıksız'}", expanded=False):
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
-                        st.write(f"**Yazar:** {metadata.get('author', 'Bilinmiyor')}")
-                        st.write(f"**Kaynak:** {metadata.get('source', 'Bilinmiyor')}")
-                        st.write(f"**Dosya:** {metadata.get('file', 'Bilinmiyor')}")
+                        st.write(f"**Yazar:** {metadata.get('author') or 'Bilinmiyor'}")
+                        st.write(f"**Kaynak:** {metadata.get('source') or 'Bilinmiyor'}")
+                        st.write(f"**Dosya:** {metadata.get('file') or 'Bilinmiyor'}")
                         # Chunk bilgisini göster
-                        if doc_info['chunks']:
-                            st.write(f"**Bölüm Sayısı:** {len(doc_info['chunks'])}")
+                        if metadata.get("chunks", 1) > 1:
+                            st.write(f"**Bölüm Sayısı:** {metadata['chunks']}")
                     
                     with col2:
                         if st.button(f"Sil", key=f"delete_{doc_id}"):
@@ -731,42 +864,44 @@ elif page == "Veritabanı Yönetimi":
         with st.form("search_form"):
             query = st.text_input("Arama Sorgusu")
             n_results = st.slider("Maksimum Sonuç", min_value=1, max_value=20, value=5)
+            
+            # Filtreler arama sırasında dizinde uygulanır
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                year_range = st.text_input("Yıl Aralığı (ör. 2021-2023)")
+            with col2:
+                categories = st.text_input("Kategoriler (ör. cs.LG, stat.ML)")
+            with col3:
+                arxiv_ids = st.text_input("ArXiv ID")
             submitted = st.form_submit_button("Ara")
         
         if submitted and query:
+            search_filter = SearchFilter()
+            start, separator, end = (part.strip() for part in year_range.partition("-"))
+            if not separator:
+                end = start  # Tek yıl
+            search_filter.years(int(start) if start.isdigit() else None, int(end) if end.isdigit() else None)
+            search_filter.categories(*categories.replace(",", " ").split())
+            search_filter.arxiv_ids(*arxiv_ids.replace(",", " ").split())
+            
             with st.spinner("Aranıyor..."):
-                results = chroma_manager.search(query, n_results=n_results)
+                # Sonuçlar ana belgeye göre gruplanmış gelir
+                main_documents = chroma_manager.search_many([query], n_results=n_results, filter_query=search_filter)[0]
                 
-                if results["ids"] and results["ids"][0]:
-                    # Sonuçları grupla
-                    main_documents = {}
-                    for doc_id, doc, metadata in zip(
-                        results["ids"][0], results["documents"][0], results["metadatas"][0]
-                    ):
-                        if '_chunk_' in doc_id:
-                            main_id = doc_id.split('_chunk_')[0]
-                            if main_id not in main_documents:
-                                main_documents[main_id] = {
-                                    'id': main_id,
-                                    'metadata': metadata,
-                                    'chunks': []
-                                }
-                            main_documents[main_id]['chunks'].append((doc_id, doc))
-                        else:
-                            main_documents[doc_id] = {
-                                'id': doc_id,
-                                'metadata': metadata,
-                                'chunks': [(doc_id, doc)]
-                            }
-                    
+                if main_documents:
                     st.success(f"{len(main_documents)} sonuç bulundu.")
                     
                     # Ana belgeleri göster
-                    for i, (doc_id, doc_info) in enumerate(main_documents.items()):
+                    for i, doc_info in enumerate(main_documents):
+                        doc_id = doc_info['id']
                         metadata = doc_info['metadata']
                         with st.expander(f"{i+1}. {metadata.get('title', 'Başlıksız')}"):
                             st.write(f"**ID:** {doc_id}")
                             st.write(f"**Yazarlar:** {metadata.get('author', metadata.get('authors', 'Belirtilmemiş'))}")
+                            if metadata.get("year"):
+                                st.write(f"**Yıl:** {metadata['year']}")
+                            if metadata.get("categories"):
+                                st.write(f"**Kategoriler:** {metadata['categories']}")
                             
                             # İlk chunk'ın içeriğini göster
                             if doc_info['chunks']:
@@ -781,7 +916,7 @@ elif page == "Veritabanı Yönetimi":
                                     st.markdown(get_pdf_download_link(metadata['file_path']), unsafe_allow_html=True)
                 else:
                     st.info("Sonuç bulunamadı.")
-    
+
 
 # Başlangıçta oturum durumunu ayarla
 if "page" in st.session_state:
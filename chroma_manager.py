@@ -1,99 +1,190 @@
 import os
 import chromadb
+import re
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 from pdf_processor import PDFProcessor
-import re
+from document_registry import DocumentRegistry
+from document_catalog import DocumentCatalog
+from embedding_cache import EmbeddingCache
+from near_duplicates import NearDuplicateIndex, estimate_similarity
+from lexical_index import LexicalIndex
+from search_filter import SearchFilter, category_field, published_epoch
+from query_cache import QueryCache
+from embeddings import OnnxMiniLMEmbedding
+from chunking import TokenChunker
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 class ChromaManager:
-    def __init__(self, db_path="./chroma_data"):
+    def __init__(self, db_path="./chroma_data", embedding_function=None):
         """
         ChromaDB veritabanı yöneticisi.
         
         Args:
             db_path (str): Veritabanı dizini.
+            embedding_function (EmbeddingFunction, optional): Parçaları ve
+                sorguları vektöre çeviren fonksiyon (bkz. embeddings.py);
+                None ise all-MiniLM-L6-v2 kullanılır. Koleksiyon farklı bir
+                modelle oluşturulmuşsa açılmaz.
         """
         self.db_path = db_path
         self.collection_name = "knowledge"  # Tek bir sabit koleksiyon adı
+        self.write_batch_size = 64  # Tek yazma çağrısındaki en fazla parça sayısı
         
         if not os.path.exists(db_path):
             os.makedirs(db_path)
         
+        # Eklenmiş dosyaların ham hash dizini
+        self.registry = DocumentRegistry(db_path)
+        # Belge başına tek satırlık katalog (listeleme ve sayfalama için)
+        self.catalog = DocumentCatalog(db_path)
+        
+        # Parça embedding'leri önbellekten gelir, model kimliği önbellek anahtarının parçasıdır
+        self.embedding_function = embedding_function or OnnxMiniLMEmbedding()
+        self.embedding_model = getattr(
+            self.embedding_function, "model_id", type(self.embedding_function).__name__
+        )
+        self.embedding_cache = EmbeddingCache(os.path.join(db_path, "embedding_cache"))
+        
+        # Parça boyutu modelin token penceresinden alınır; fazlası zaten embed edilmez
+        self.chunker = TokenChunker.for_embedding(self.embedding_function)
+        # Kaynakça, teşekkür ve üst/alt bilgileri parçalamadan önce at
+        self.clean_pages = True
+        
+        # Belgelerin MinHash imzaları; yakın kopyalar embedding'den önce yakalanır
+        self.near_duplicates = NearDuplicateIndex(db_path)
+        self.near_duplicate_threshold = 0.85  # En düşük tahmini Jaccard benzerliği
+        # Benzerlik yalnızca belgelerin başından tahmin edildiği için varsayılan işaretlemektir
+        self.near_duplicate_action = "flag"  # "skip" (ekleme), "flag" (işaretle) veya None
+        self.near_duplicate_window = 20000  # İmza için belgenin başından okunan karakter
+        
+        # Tekrarlanan aramalar için sonuç önbelleği; her yazma ve silmede geçersizleşir
+        self.query_cache = QueryCache()
+        
+        # Tam terim aramaları (arXiv ID'si, model adı, denklem etiketi) için BM25 dizini
+        self.lexical_index = LexicalIndex(db_path)
+        self.rrf_k = 60  # Karma aramada sıralama birleştirme (RRF) sabiti
+        
         try:
             # Chroma istemcisini başlat
             self.client = chromadb.PersistentClient(path=db_path)
-            
-            # Koleksiyonu oluştur veya mevcut olanı al
-            try:
-                self.collection = self.client.get_collection(name=self.collection_name)
-                print(f"Mevcut koleksiyon alındı: {self.collection_name}")
-            except:
-                self.collection = self.client.create_collection(name=self.collection_name)
-                print(f"Yeni koleksiyon oluşturuldu: {self.collection_name}")
         except Exception as e:
             print(f"ChromaDB başlatma hatası: {e}")
             # Hata durumunda varsayılan ayarlarla tekrar dene
             self.client = chromadb.Client()
-            try:
-                self.collection = self.client.get_collection(name=self.collection_name)
-            except:
-                self.collection = self.client.create_collection(name=self.collection_name)
+        
+        self.collection = self._open_collection()
+        
+        # Katalogdan ve kelime dizininden önce oluşturulmuş koleksiyonlar için bir kez doldur
+        if self.collection.count() > 0:
+            if self.catalog.count() == 0:
+                self.rebuild_catalog()
+            if self.lexical_index.count() == 0:
+                self.rebuild_lexical_index()
     
-    def _chunk_text(self, text, max_chunk_size):
+    def _open_collection(self):
         """
-        Metni belirtilen boyutta parçalara böler.
+        Koleksiyonu açar, yoksa oluşturur. Koleksiyon metadata'sında kayıtlı
+        embedding modeli kullanılan modelle aynı değilse farklı vektör
+        uzaylarını karıştırmamak için hata verir.
         
-        Args:
-            text (str): Bölünecek metin
-            max_chunk_size (int): Her parçanın maksimum karakter sayısı
-            
         Returns:
-            list: Metin parçalarının listesi
+            chromadb.Collection: Koleksiyon.
         """
-        chunks = []
-        current_chunk = []
-        current_size = 0
+        try:
+            collection = self.client.get_collection(
+                name=self.collection_name,
+                embedding_function=self.embedding_function
+            )
+        except ValueError:
+            collection = self.client.create_collection(
+                name=self.collection_name,
+                embedding_function=self.embedding_function,
+                metadata={"embedding_model": self.embedding_model}
+            )
+            print(f"Yeni koleksiyon oluşturuldu: {self.collection_name}")
+            return collection
         
-        # Metni cümlelere böl
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        # Model kaydı olmayan eski koleksiyonlar Chroma'nın varsayılan modeliyle oluşturulmuştur
+        metadata = collection.metadata or {}
+        stored_model = metadata.get("embedding_model", OnnxMiniLMEmbedding.model_id)
+        if stored_model != self.embedding_model:
+            raise ValueError(
+                f"Koleksiyon '{self.collection_name}' {stored_model} modeliyle oluşturulmuş, "
+                f"{self.embedding_model} ile açılamaz."
+            )
+        if "embedding_model" not in metadata:
+            collection.modify(metadata={**metadata, "embedding_model": self.embedding_model})
         
-        for sentence in sentences:
-            sentence_size = len(sentence)
-            
-            # Eğer tek bir cümle maksimum boyuttan büyükse, kelimelere böl
-            if sentence_size > max_chunk_size:
-                words = sentence.split()
-                current_word_chunk = []
-                current_word_size = 0
-                
-                for word in words:
-                    word_size = len(word) + 1  # +1 for space
-                    if current_word_size + word_size > max_chunk_size:
-                        chunks.append(' '.join(current_word_chunk))
-                        current_word_chunk = [word]
-                        current_word_size = word_size
-                    else:
-                        current_word_chunk.append(word)
-                        current_word_size += word_size
-                
-                if current_word_chunk:
-                    chunks.append(' '.join(current_word_chunk))
-                continue
-            
-            # Normal cümle işleme
-            if current_size + sentence_size > max_chunk_size:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [sentence]
-                current_size = sentence_size
-            else:
-                current_chunk.append(sentence)
-                current_size += sentence_size
+        print(f"Mevcut koleksiyon alındı: {self.collection_name}")
+        return collection
+    
+    @staticmethod
+    def _iter_tracked_pages(pages, content_hash, state, head_chars=0):
+        """
+        Sayfaları olduğu gibi aktarırken metin hash'ini ve boyutunu günceller,
+        ilk sayfayı metadata tahmini, belgenin başını yakın kopya imzası için
+        saklar.
         
-        # Son parçayı ekle
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        Args:
+            pages (iterable): Sayfa metinleri
+            content_hash: hashlib nesnesi
+            state (dict): "size", "first_page" ve "head" alanları güncellenir
+            head_chars (int): "head" alanında saklanacak en fazla karakter
         
-        return chunks
+        Yields:
+            str: Sayfa metni
+        """
+        state.setdefault("head", "")
+        for page_text in pages:
+            content_hash.update(page_text.encode())
+            state["size"] += len(page_text)
+            if state["first_page"] is None:
+                state["first_page"] = page_text
+            if len(state["head"]) < head_chars:
+                state["head"] += page_text[:head_chars - len(state["head"])]
+            yield page_text
+    
+    def _iter_collection(self, include=("metadatas",), fields=None, where=None, page_size=1000):
+        """
+        Koleksiyonu sabit boyutlu sayfalar halinde dolaşır; bellekte aynı anda
+        en fazla bir sayfa tutulur. Yalnızca istenen alanlar okunur.
+        
+        Dolaşma offset ile yapıldığından, dolaşırken koleksiyondan kayıt
+        silinmemelidir; silinecek ID'ler önce toplanmalıdır.
+        
+        Args:
+            include (tuple): Okunacak alanlar ("metadatas", "documents");
+                boşsa yalnızca ID'ler okunur
+            fields (tuple, optional): Döndürülecek metadata alanları, None ise tümü
+            where (dict, optional): Metadata filtresi
+            page_size (int): Sayfa başına kayıt sayısı
+        
+        Yields:
+            tuple: (ID, metadata, metin); okunmayan alanlar için None
+        """
+        offset = 0
+        while True:
+            page = self.collection.get(
+                where=where,
+                include=list(include),
+                limit=page_size,
+                offset=offset
+            )
+            ids = page["ids"]
+            metadatas = page.get("metadatas") or [None] * len(ids)
+            documents = page.get("documents") or [None] * len(ids)
+            
+            for chunk_id, metadata, document in zip(ids, metadatas, documents):
+                if "metadatas" in include:
+                    metadata = metadata or {}
+                    if fields is not None:
+                        metadata = {name: metadata[name] for name in fields if name in metadata}
+                yield chunk_id, metadata, document
+            
+            if len(ids) < page_size:
+                return
+            offset += page_size
     
     def get_collections(self):
         """
@@ -114,188 +205,1480 @@ class ChromaManager:
         """
         return self.collection
     
-    def add_pdf(self, pdf_path, metadata=None, collection_name=None):
+    @staticmethod
+    def _prepare_metadata(processor, pdf_metadata):
+        """
+        Koleksiyona yazılacak basit metadata'yı ve belge ID'sini hazırlar.
+        Eklenme zamanı "added_at" alanına Unix zamanı olarak yazılır.
+        
+        Filtrelenebilir alanlar (bkz. SearchFilter): yayın tarihi "published"
+        (Unix zamanı) ve "year" (tam sayı), her kategori için mantıksal bir
+        "cat_*" alanı (görüntüleme için "categories" metni) ve sürümsüz arXiv
+        ID'si "arxiv_base".
+        
+        Args:
+            processor (PDFProcessor): Belgenin işleyicisi
+            pdf_metadata (dict): PDF'den çıkarılan ve kullanıcının verdiği metadata
+        
+        Returns:
+            tuple: (belge ID'si, basit metadata)
+        """
+        pdf_path = processor.pdf_path
+        # Sadece gerekli ve basit metadata alanlarını al
+        simple_metadata = {
+            "title": str(pdf_metadata.get("title", ""))[:100],
+            "author": str(pdf_metadata.get("authors", ""))[:100],
+            "source": str(pdf_metadata.get("source", ""))[:20],
+            "file": os.path.basename(pdf_path),
+            "added_at": datetime.now().timestamp()
+        }
+        
+        published = published_epoch(pdf_metadata.get("published"))
+        if published is not None:
+            simple_metadata["published"] = published
+            simple_metadata["year"] = datetime.fromtimestamp(published, timezone.utc).year
+        
+        categories = pdf_metadata.get("categories") or []
+        if isinstance(categories, str):
+            categories = categories.replace(",", " ").split()
+        categories = [str(category).strip() for category in categories if str(category).strip()]
+        if categories:
+            simple_metadata["categories"] = ", ".join(categories)
+            for category in categories:
+                simple_metadata[category_field(category)] = True
+        
+        # Benzersiz ID oluştur (metin hash'i henüz bilinmediği için dosya hash'i kullanılır)
+        if "arxiv_id" in pdf_metadata:
+            # Sürümler aynı belge ID'sini paylaşır, yeni sürüm eskisini günceller
+            simple_metadata["arxiv_id"] = str(pdf_metadata["arxiv_id"])
+            doc_id = _arxiv_base(simple_metadata["arxiv_id"])
+            simple_metadata["arxiv_base"] = doc_id
+        else:
+            file_name = os.path.basename(pdf_path).replace(".pdf", "")
+            doc_id = f"{file_name}_{processor.file_hash()[:8]}"
+        simple_metadata["doc_id"] = doc_id
+        
+        return doc_id, simple_metadata
+    
+    def _stored_metadata(self, doc_id):
+        """
+        Kayıtlı belgenin bir kaydının metadata'sını döndürür.
+        
+        Args:
+            doc_id (str): Belge ID'si
+        
+        Returns:
+            dict: Metadata, belge yoksa None
+        """
+        queries = (
+            {"ids": [doc_id]},  # Tek parçalı belge
+            {"where": {"doc_id": doc_id}, "limit": 1},
+            {"ids": [f"{doc_id}_chunk_0"]}  # Sıra numaralı parça ID'leri kullanan eski kayıtlar
+        )
+        for query in queries:
+            result = self.collection.get(include=["metadatas"], **query)
+            if result["ids"]:
+                return result["metadatas"][0] or {}
+        return None
+    
+    def _find_duplicate(self, doc_id=None, content_hash=None, exclude_doc_id=None):
+        """
+        Aynı ID'ye veya aynı metin hash'ine sahip kayıtlı bir belge arar.
+        Sonuçtaki "id" her zaman belge ID'sidir, parça ID'si değildir.
+        
+        Args:
+            doc_id (str, optional): Belge ID'si
+            content_hash (str, optional): Metin hash'i
+            exclude_doc_id (str, optional): Hash aramasında yok sayılacak belge
+                (güncellenen belgenin kendi parçaları)
+        
+        Returns:
+            dict: Duplikasyon varsa hata sonucu, yoksa None
+        """
+        existing_id = None
+        try:
+            if doc_id is not None:
+                stored = self._stored_metadata(doc_id)
+                if stored is not None:
+                    existing_id = stored.get("doc_id") or doc_id
+            
+            if existing_id is None and content_hash is not None:
+                # Hash ile mevcut belgeleri ara (yalnızca belge ID'leri, ilk eşleşmede dur)
+                for result_id, metadata, _ in self._iter_collection(fields=("doc_id",), where={"hash": content_hash}):
+                    # Bulunan kayıt bir parçadır; sonuç ve ham hash dizini belge ID'sini tutar
+                    result_doc_id = metadata.get("doc_id") or result_id.split('_chunk_')[0]
+                    if result_doc_id == exclude_doc_id:
+                        continue
+                    existing_id = result_doc_id
+                    break
+        except Exception as e:
+            print(f"Duplikasyon kontrolü sırasında hata: {e}")
+        
+        if existing_id is None:
+            return None
+        return {
+            "success": False, 
+            "error": "Bu belge (veya çok benzer içeriğe sahip bir belge) zaten veritabanında mevcut.",
+            "id": existing_id
+        }
+    
+    def _check_near_duplicate(self, text, doc_id, staged=None):
+        """
+        Belgenin başından MinHash imzasını hesaplar ve LSH dizininde (ve
+        henüz yazılmamış gruptaki belgelerde) eşiği geçen en benzer belgeyi
+        arar. near_duplicate_action None ise yalnızca imza hesaplanır.
+        
+        İmza yalnızca ilk near_duplicate_window karakteri kapsar; benzerlik
+        belgelerin tamamı için değil, başlangıçları için bir tahmindir.
+        
+        Args:
+            text (str): Belgenin baştaki metni
+            doc_id (str): Belge ID'si (kendi kaydı ve eski sürümleri yok sayılır)
+            staged (dict, optional): Bekleyen gruptaki belge ID'si -> imza
+        
+        Returns:
+            tuple: (imza, (benzer belge ID'si, benzerlik) veya None)
+        """
+        try:
+            signature = self.near_duplicates.signature(text)
+            if signature is None or not self.near_duplicate_action:
+                return signature, None
+            
+            match = self.near_duplicates.find(
+                signature, self.near_duplicate_threshold, exclude_doc_id=doc_id
+            )
+            for staged_id, staged_signature in (staged or {}).items():
+                similarity = estimate_similarity(signature, staged_signature)
+                if similarity >= self.near_duplicate_threshold and (match is None or similarity > match[1]):
+                    match = (staged_id, similarity)
+            return signature, match
+        except Exception as e:
+            print(f"Yakın kopya kontrolü sırasında hata: {e}")
+            return None, None
+    
+    def _near_duplicate_result(self, match, simple_metadata):
+        """
+        Yakın kopya bulunduğunda ayara göre sonucu hazırlar: "skip" ise hata
+        sonucu döner, "flag" ise belge metadata'sına benzer belge yazılır.
+        Benzerlik belgelerin ilk near_duplicate_window karakterinden
+        tahmin edilir; sonuçtaki "compared_chars" bu sınırı verir.
+        
+        Args:
+            match (tuple): (benzer belge ID'si, benzerlik)
+            simple_metadata (dict): Eklenen belgenin metadata'sı
+        
+        Returns:
+            dict: Belge atlanacaksa hata sonucu ("similar_id" alanında benzer
+                belge; belge eklenmediği için "id" None), yoksa None
+        """
+        similar_id, similarity = match
+        window = self.near_duplicate_window
+        if self.near_duplicate_action == "skip":
+            return {
+                "success": False,
+                "error": (
+                    f"Bu belgenin başı kayıtlı bir belgeninkiyle neredeyse aynı "
+                    f"(ilk {window} karakter için tahmini benzerlik %{similarity * 100:.0f})."
+                ),
+                "id": None,
+                "similar_id": similar_id,
+                "similarity": similarity,
+                "compared_chars": window
+            }
+        print(f"Yakın kopya ({simple_metadata['doc_id']} ~ {similar_id}): ilk {window} karakterde %{similarity * 100:.0f}")
+        simple_metadata["near_duplicate_of"] = similar_id
+        return None
+    
+    def _index_signature(self, doc_id, signature):
         """
-        PDF'i veritabanına ekler.
+        Eklenen belgenin imzasını LSH dizinine yazar.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            signature (list): İmza, None ise bir şey yapılmaz
+        """
+        if signature is None:
+            return
+        try:
+            self.near_duplicates.add(doc_id, signature)
+        except Exception as e:
+            print(f"Yakın kopya dizini yazma hatası: {e}")
+    
+    def _catalog_document(self, doc_id, simple_metadata, chunk_count, text_bytes):
+        """
+        Eklenen veya güncellenen belgeyi kataloğa yazar; belge ve parça
+        sayaçları aynı işlemde güncellenir.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            simple_metadata (dict): Belge metadata'sı
+            chunk_count (int): Parça sayısı
+            text_bytes (int): Parça metinlerinin toplam boyutu (UTF-8 bayt)
+        """
+        try:
+            self.catalog.add(doc_id, simple_metadata, chunk_count, text_bytes)
+        except Exception as e:
+            print(f"Katalog yazma hatası: {e}")
+    
+    @staticmethod
+    def _cleanup_report(processor, chunker):
+        """
+        Sayfa temizlemenin kazancını özetler. Atlanan parça sayısı, atılan
+        metnin token sayısı ve parçalayıcının adım boyundan tahmin edilir.
+        
+        Args:
+            processor (PDFProcessor): iter_clean_pages ile okunmuş işleyici
+            chunker (TokenChunker): Parçalayıcı
+        
+        Returns:
+            dict: "chars_saved", "chunks_saved", "sections",
+                "header_footer_lines" ve "dehyphenated" alanları; temizleme
+                yapılmadıysa None
+        """
+        stats = processor.cleanup_stats
+        if not stats:
+            return None
+        
+        # Ardışık parçalar overlap kadar örtüştüğünden her parça bu kadar yeni token taşır
+        step = max(chunker.max_tokens - chunker.overlap, 1)
+        return {
+            "chars_saved": stats["chars_in"] - stats["chars_out"],
+            "chunks_saved": -(-stats["tokens_removed"] // step),
+            "sections": stats["skipped_sections"],
+            "header_footer_lines": stats["header_footer_lines"],
+            "dehyphenated": stats["dehyphenated"]
+        }
+    
+    def _find_registered(self, file_hash):
+        """
+        Ham dosya hash'i daha önce eklenmiş bir belgeye aitse duplikasyon
+        sonucunu döndürür. PDF açılmadan, yalnızca yerel dizin ve ID ile
+        koleksiyon sorgusu kullanılır.
+        
+        Args:
+            file_hash (str): Dosyanın ham baytlarının hash'i
+        
+        Returns:
+            dict: Duplikasyon varsa hata sonucu, yoksa None
+        """
+        if file_hash is None:
+            return None
+        
+        doc_id = self.registry.find(file_hash)
+        if doc_id is None:
+            return None
+        
+        duplicate = self._find_duplicate(doc_id=doc_id)
+        if duplicate is None:
+            # Belge koleksiyondan başka yolla silinmiş, kaydı temizle
+            self.registry.remove_file(file_hash)
+        return duplicate
+    
+    @staticmethod
+    def _file_hash(pdf_path):
+        """
+        Dosyanın ham hash'ini döndürür; okunamayan dosyalar için None.
         
         Args:
             pdf_path (str): PDF dosya yolu
+        
+        Returns:
+            str: Hex hash veya None
+        """
+        try:
+            return PDFProcessor(pdf_path).file_hash()
+        except Exception as e:
+            print(f"Dosya hash hatası ({pdf_path}): {e}")
+            return None
+    
+    @staticmethod
+    def _chunk_metadatas(simple_metadata, chunk_count):
+        """
+        Her parça için parça numarası ve toplam parça sayısını içeren metadata üretir.
+        
+        Args:
+            simple_metadata (dict): Belge metadata'sı
+            chunk_count (int): Toplam parça sayısı
+        
+        Returns:
+            list: Parça metadata listesi
+        """
+        chunk_metadatas = []
+        for i in range(chunk_count):
+            chunk_metadata = simple_metadata.copy()
+            chunk_metadata["chunk"] = i  # Daha basit bir isim
+            chunk_metadata["chunks"] = chunk_count  # Daha basit bir isim
+            chunk_metadatas.append(chunk_metadata)
+        return chunk_metadatas
+    
+    @staticmethod
+    def _chunk_ids(doc_id, chunks, seen=None):
+        """
+        Parça ID'lerini parça metninin hash'inden üretir; böylece bir belgenin
+        yeni sürümünde değişmeyen parçalar aynı ID'yi alır. Aynı belgede
+        tekrar eden metinler sıra ekiyle ayrılır.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            chunks (list): Parça metinleri
+            seen (dict, optional): Akış halinde yazarken gruplar arasında
+                taşınan tekrar sayaçları
+        
+        Returns:
+            list: Parça ID'leri
+        """
+        seen = {} if seen is None else seen
+        chunk_ids = []
+        for chunk in chunks:
+            chunk_hash = hashlib.md5(chunk.encode("utf-8")).hexdigest()[:16]
+            repeat = seen.get(chunk_hash, 0)
+            seen[chunk_hash] = repeat + 1
+            suffix = f"_{repeat}" if repeat else ""
+            chunk_ids.append(f"{doc_id}_chunk_{chunk_hash}{suffix}")
+        return chunk_ids
+    
+    def _is_newer_version(self, doc_id, simple_metadata):
+        """
+        Eklenen belge, kayıtlı belgenin daha yeni bir arXiv sürümü mü?
+        
+        Args:
+            doc_id (str): Belge ID'si (sürümsüz arXiv ID'si)
+            simple_metadata (dict): Eklenen belgenin metadata'sı
+        
+        Returns:
+            bool: Yeni sürümse True
+        """
+        arxiv_id = simple_metadata.get("arxiv_id")
+        if not arxiv_id:
+            return False
+        stored = self._stored_metadata(doc_id) or {}
+        return _arxiv_version(arxiv_id) > _arxiv_version(stored.get("arxiv_id", ""))
+    
+    def _stored_chunk_ids(self, doc_id):
+        """
+        Belgenin koleksiyondaki tüm kayıt ID'lerini döndürür.
+        
+        Args:
+            doc_id (str): Belge ID'si
+        
+        Returns:
+            set: Kayıt ID'leri
+        """
+        stored_ids = {chunk_id for chunk_id, _, _ in self._iter_collection(include=(), where={"doc_id": doc_id})}
+        stored_ids.update(self.collection.get(ids=[doc_id], include=[])["ids"])
+        
+        # Sıra numaralı parça ID'leri kullanan eski kayıtlar
+        legacy = self.collection.get(ids=[f"{doc_id}_chunk_0"], include=["metadatas"])
+        if legacy["ids"]:
+            chunk_count = (legacy["metadatas"][0] or {}).get("chunks", 1)
+            stored_ids.update(self.collection.get(
+                ids=[f"{doc_id}_chunk_{i}" for i in range(chunk_count)],
+                include=[]
+            )["ids"])
+        return stored_ids
+    
+    def _upsert_version(self, doc_id, chunks, simple_metadata):
+        """
+        Kayıtlı belgeyi yeni sürümün parçalarıyla günceller. Parça ID'leri
+        metin hash'inden geldiği için yalnızca değişen parçalar embed edilip
+        yazılır, yeni sürümde olmayan parçalar silinir, değişmeyenlerin
+        yalnızca metadata'sı değiştirilir. Eski sürümde olup yeni sürümde
+        olmayan metadata alanları (kategoriler, "extraction" gibi) silinir.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            chunks (list): Yeni sürümün parçaları
+            simple_metadata (dict): Yeni sürümün metadata'sı
+        
+        Returns:
+            dict: "added", "unchanged" ve "removed" parça sayıları
+        """
+        stored_ids = self._stored_chunk_ids(doc_id)
+        
+        if len(chunks) == 1:
+            new_ids = [doc_id]
+            metadatas = [simple_metadata]
+        else:
+            new_ids = self._chunk_ids(doc_id, chunks)
+            metadatas = self._chunk_metadatas(simple_metadata, len(chunks))
+        
+        # Tek parçalı belge ID'si içerikten bağımsızdır, her zaman yeniden yazılır
+        changed = [i for i, chunk_id in enumerate(new_ids) if chunk_id not in stored_ids or chunk_id == doc_id]
+        unchanged = [i for i, chunk_id in enumerate(new_ids) if chunk_id in stored_ids and chunk_id != doc_id]
+        stale = stored_ids - set(new_ids)
+        
+        # Yarıda kalırsa yeni yazılan parçaları geri al, belge eski sürümde kalsın
+        added_ids = [new_ids[i] for i in changed if new_ids[i] not in stored_ids]
+        try:
+            self._write_in_batches(
+                self._upsert_chunks,
+                [new_ids[i] for i in changed],
+                documents=[chunks[i] for i in changed],
+                metadatas=[metadatas[i] for i in changed]
+            )
+        except Exception:
+            self._rollback(added_ids)
+            raise
+        try:
+            # Üzerine yazılan kayıtlarda (tek parçalı belge dahil) eski alanları temizle
+            replaced = [i for i, chunk_id in enumerate(new_ids) if chunk_id in stored_ids]
+            self._write_in_batches(
+                self._replace_metadatas,
+                [new_ids[i] for i in replaced],
+                metadatas=[metadatas[i] for i in replaced]
+            )
+        except Exception:
+            self._rollback(added_ids)
+            raise
+        
+        self._rollback(sorted(stale))
+        return {"added": len(changed), "unchanged": len(unchanged), "removed": len(stale)}
+    
+    def _replace_metadatas(self, ids, metadatas):
+        """
+        Kayıtların metadata'sını verilenlerle değiştirir. Chroma güncellemede
+        metadata'yı birleştirdiğinden ve alan silmeyi desteklemediğinden,
+        yeni metadata'da bulunmayan alanları olan kayıtlar kayıtlı
+        embedding'leri ve metinleriyle yeniden yazılır; model çalıştırılmaz.
+        
+        Args:
+            ids (list): Kayıt ID'leri
+            metadatas (list): Yeni metadata'lar
+        """
+        new_metadatas = dict(zip(ids, metadatas))
+        stored = self.collection.get(ids=ids, include=["metadatas"])
+        stale_ids = [
+            chunk_id for chunk_id, metadata in zip(stored["ids"], stored["metadatas"])
+            if set(metadata or {}) - set(new_metadatas[chunk_id])
+        ]
+        
+        stale = set(stale_ids)
+        merged_ids = [chunk_id for chunk_id in ids if chunk_id not in stale]
+        if merged_ids:
+            self.collection.update(
+                ids=merged_ids,
+                metadatas=[new_metadatas[chunk_id] for chunk_id in merged_ids]
+            )
+        if not stale_ids:
+            return
+        
+        records = self.collection.get(ids=stale_ids, include=["embeddings", "documents", "metadatas"])
+        self.collection.delete(ids=records["ids"])
+        try:
+            self.collection.add(
+                ids=records["ids"],
+                embeddings=records["embeddings"],
+                documents=records["documents"],
+                metadatas=[new_metadatas[chunk_id] for chunk_id in records["ids"]]
+            )
+        except Exception:
+            # Silinen kayıtları eski metadata'larıyla geri yaz
+            self.collection.add(
+                ids=records["ids"],
+                embeddings=records["embeddings"],
+                documents=records["documents"],
+                metadatas=records["metadatas"]
+            )
+            raise
+    
+    def _remove_legacy_versions(self, doc_id, simple_metadata):
+        """
+        Sürüm ekiyle kaydedilmiş eski kayıtları ("2401.01234v1") siler; bu
+        sürümler artık sürümsüz belge ID'si altında tutulur.
+        
+        Args:
+            doc_id (str): Belge ID'si (sürümsüz arXiv ID'si)
+            simple_metadata (dict): Eklenen belgenin metadata'sı
+        """
+        version = _arxiv_version(simple_metadata.get("arxiv_id", ""))
+        legacy_ids = [f"{doc_id}v{k}" for k in range(1, version + 1)]
+        if not legacy_ids:
+            return
+        
+        try:
+            found = self.collection.get(
+                ids=legacy_ids + [f"{legacy_id}_chunk_0" for legacy_id in legacy_ids],
+                include=[]
+            )["ids"]
+            for legacy_id in sorted({found_id.split('_chunk_')[0] for found_id in found}):
+                print(f"Eski sürüm kaldırılıyor: {legacy_id}")
+                self.delete_document(legacy_id)
+        except Exception as e:
+            print(f"Eski sürüm silme hatası: {e}")
+    
+    def _batch_limit(self):
+        """
+        Tek bir add/update çağrısına verilecek en fazla kayıt sayısını döndürür.
+        write_batch_size, Chroma'nın kabul ettiği üst sınırla kısıtlanır.
+        
+        Returns:
+            int: Kayıt sayısı
+        """
+        limit = self.write_batch_size
+        max_batch_size = getattr(self.client, "max_batch_size", None)
+        if max_batch_size:
+            limit = min(limit, max_batch_size)
+        return max(limit, 1)
+    
+    def _add_chunks(self, ids, documents, metadatas):
+        """
+        Parçaları koleksiyona ekler. Embedding'ler önbellekten alınır,
+        yalnızca önbellekte olmayan metinler için model çalıştırılır.
+        
+        Args:
+            ids (list): Parça ID'leri
+            documents (list): Parça metinleri
+            metadatas (list): Parça metadata'ları
+        """
+        try:
+            self.collection.add(
+                documents=documents,
+                embeddings=self._embed(documents),
+                metadatas=metadatas,
+                ids=ids
+            )
+            self._index_terms(ids, documents, metadatas)
+        finally:
+            self.query_cache.bump()
+    
+    def _upsert_chunks(self, ids, documents, metadatas):
+        """
+        _add_chunks ile aynı, ancak mevcut ID'lerin üzerine yazar.
+        
+        Args:
+            ids (list): Parça ID'leri
+            documents (list): Parça metinleri
+            metadatas (list): Parça metadata'ları
+        """
+        try:
+            self.collection.upsert(
+                documents=documents,
+                embeddings=self._embed(documents),
+                metadatas=metadatas,
+                ids=ids
+            )
+            self._index_terms(ids, documents, metadatas)
+        finally:
+            self.query_cache.bump()
+    
+    def _index_terms(self, ids, documents, metadatas):
+        """
+        Yazılan parçaları kelime dizinine ekler. Dizin hatası yazmayı geri
+        almaz; dizin rebuild_lexical_index ile koleksiyondan yenilenebilir.
+        
+        Args:
+            ids (list): Parça ID'leri
+            documents (list): Parça metinleri
+            metadatas (list): Parça metadata'ları
+        """
+        try:
+            doc_ids = [
+                (metadata or {}).get("doc_id") or chunk_id.split('_chunk_')[0]
+                for chunk_id, metadata in zip(ids, metadatas)
+            ]
+            self.lexical_index.add(ids, doc_ids, documents)
+        except Exception as e:
+            print(f"Kelime dizini hatası: {e}")
+    
+    def _embed(self, documents):
+        """
+        Metinlerin embedding'lerini önbellek üzerinden hesaplar.
+        
+        Args:
+            documents (list): Metinler
+        
+        Returns:
+            list: Vektörler
+        """
+        return self.embedding_cache.embed(
+            self.embedding_model,
+            documents,
+            self.embedding_function
+        )
+    
+    def _write_in_batches(self, write, ids, **fields):
+        """
+        Kayıtları boyutu sınırlı gruplar halinde koleksiyona yazar; her grup
+        için tek bir embedding ve kalıcılık çağrısı yapılır. Eklemelerden biri
+        başarısız olursa bu çağrıda eklenmiş gruplar geri alınır.
+        
+        Args:
+            write (callable): self._add_chunks, self._upsert_chunks veya
+                self._replace_metadatas
+            ids (list): Kayıt ID'leri
+            **fields: ids ile aynı uzunlukta listeler (documents, metadatas)
+        """
+        limit = self._batch_limit()
+        start = 0
+        try:
+            while start < len(ids):
+                write(
+                    ids=ids[start:start + limit],
+                    **{name: values[start:start + limit] for name, values in fields.items()}
+                )
+                start += limit
+        except Exception:
+            if write == self._add_chunks:
+                self._rollback(ids[:start])
+            raise
+        finally:
+            self.query_cache.bump()
+    
+    def _stage_document(self, prepared, batch):
+        """
+        Metni çıkarılmış ve parçalanmış bir belgeyi bekleyen yazma grubuna
+        ekler. Koleksiyondaki ve aynı gruptaki belgelerle duplikasyon ve
+        yakın kopya kontrolü yapılır. Kayıtlı bir arXiv makalesinin yeni sürümü gruba
+        eklenmez, değişen parçaları hemen güncellenir. Aynı makalenin grupta
+        bekleyen eski bir sürümü varsa gruptan çıkarılır ve yerine yeni sürüm
+        eklenir.
+        
+        Args:
+            prepared (dict): _extract_for_ingest çıktısı
+            batch (dict): Bekleyen yazma grubu (bkz. _new_batch)
+        
+        Returns:
+            dict: İşlem sonucu; başarılıysa ve "updated" alanı yoksa kayıt
+                ancak grup yazıldığında kesinleşir
+        """
+        if prepared.get("error"):
+            return {"success": False, "error": prepared["error"], "id": None}
+        
+        doc_id = prepared["id"]
+        simple_metadata = prepared["metadata"]
+        simple_metadata["hash"] = prepared["hash"]
+        if prepared["status"] != "complete":
+            simple_metadata["extraction"] = prepared["status"]
+        chunks = prepared["chunks"]
+        
+        if doc_id in batch["doc_ids"]:
+            staged = next(result for _, result in batch["pending"] if result["success"] and result["id"] == doc_id)
+            if _arxiv_version(simple_metadata.get("arxiv_id", "")) <= _arxiv_version(staged["metadata"].get("arxiv_id", "")):
+                return {
+                    "success": False, 
+                    "error": "Bu belge (veya çok benzer içeriğe sahip bir belge) zaten veritabanında mevcut.",
+                    "id": doc_id
+                }
+            self._unstage_document(batch, doc_id)
+        
+        staged_id = batch["hashes"].get(prepared["hash"])
+        if staged_id is not None:
+            return {
+                "success": False, 
+                "error": "Bu belge (veya çok benzer içeriğe sahip bir belge) zaten veritabanında mevcut.",
+                "id": staged_id
+            }
+        
+        duplicate = self._find_duplicate(doc_id=doc_id)
+        if duplicate and not self._is_newer_version(doc_id, simple_metadata):
+            return duplicate
+        
+        update = duplicate is not None
+        duplicate = self._find_duplicate(content_hash=prepared["hash"], exclude_doc_id=doc_id)
+        if duplicate:
+            return duplicate
+        
+        signature, match = self._check_near_duplicate(prepared["head"], doc_id, batch["signatures"])
+        if match:
+            duplicate = self._near_duplicate_result(match, simple_metadata)
+            if duplicate:
+                return duplicate
+        
+        result = {
+            "success": True, 
+            "id": doc_id, 
+            "metadata": simple_metadata,
+            "extraction_status": prepared["status"],
+            "pages": prepared["pages"],
+            "cleanup": prepared["cleanup"],
+            "chunks": len(chunks)
+        }
+        
+        if update:
+            result["updated"] = self._upsert_version(doc_id, chunks, simple_metadata)
+            self._catalog_document(doc_id, simple_metadata, len(chunks), _text_bytes(chunks))
+            self._index_signature(doc_id, signature)
+            return result
+        
+        if len(chunks) == 1:
+            batch["ids"].append(doc_id)
+            batch["metadatas"].append(simple_metadata)
+        else:
+            batch["ids"].extend(self._chunk_ids(doc_id, chunks))
+            batch["metadatas"].extend(self._chunk_metadatas(simple_metadata, len(chunks)))
+        batch["documents"].extend(chunks)
+        batch["doc_ids"].add(doc_id)
+        batch["hashes"][prepared["hash"]] = doc_id
+        batch["text_bytes"][doc_id] = _text_bytes(chunks)
+        if signature is not None:
+            batch["signatures"][doc_id] = signature
+        
+        return result
+    
+    @staticmethod
+    def _unstage_document(batch, doc_id):
+        """
+        Bekleyen bir belgeyi yazma grubundan çıkarır (ör. aynı grupta daha
+        yeni sürümü geldiğinde). Belgenin sonucu başarısız olarak işaretlenir;
+        ID'si korunur, böylece dosyası ham hash dizinine yazılır.
+        
+        Args:
+            batch (dict): Bekleyen yazma grubu
+            doc_id (str): Belge ID'si
+        """
+        keep = [i for i, metadata in enumerate(batch["metadatas"]) if metadata.get("doc_id") != doc_id]
+        for name in ("ids", "documents", "metadatas"):
+            batch[name] = [batch[name][i] for i in keep]
+        batch["doc_ids"].discard(doc_id)
+        batch["hashes"] = {content_hash: staged_id for content_hash, staged_id in batch["hashes"].items() if staged_id != doc_id}
+        batch["signatures"].pop(doc_id, None)
+        batch["text_bytes"].pop(doc_id, None)
+        
+        superseded = {
+            "success": False,
+            "error": "Aynı makalenin daha yeni bir sürümü eklendi.",
+            "id": doc_id
+        }
+        batch["pending"] = [
+            (index, superseded if result["success"] and result["id"] == doc_id else result)
+            for index, result in batch["pending"]
+        ]
+    
+    @staticmethod
+    def _new_batch():
+        """
+        Birden çok belgenin parçalarını toplayan boş bir yazma grubu oluşturur.
+        
+        Returns:
+            dict: Yazma grubu
+        """
+        return {
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "doc_ids": set(),
+            "hashes": {},
+            "signatures": {},  # Belge ID'si -> MinHash imzası
+            "text_bytes": {},  # Belge ID'si -> parça metinlerinin boyutu
+            "pending": []  # (dosya sırası, sonuç) çiftleri
+        }
+    
+    def _flush_batch(self, batch):
+        """
+        Bekleyen yazma grubunu koleksiyona yazar. Yazma yarıda kalırsa
+        gruptaki tüm parçalar geri alınır ve belgeler başarısız sayılır;
+        hiçbir belge koleksiyonda yarım kalmaz.
+        
+        Args:
+            batch (dict): Bekleyen yazma grubu
+        
+        Returns:
+            list: (dosya sırası, sonuç) çiftleri
+        """
+        try:
+            self._write_in_batches(
+                self._add_chunks,
+                batch["ids"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"]
+            )
+        except Exception as e:
+            print(f"Toplu yazma hatası: {e}")
+            return [
+                (index, {"success": False, "error": str(e), "id": None})
+                for index, _ in batch["pending"]
+            ]
+        
+        for _, result in batch["pending"]:
+            if not result["success"]:
+                continue  # Aynı grupta yeni sürümüyle değiştirilen belge
+            self._catalog_document(
+                result["id"], result["metadata"], result["chunks"], batch["text_bytes"][result["id"]]
+            )
+            self._index_signature(result["id"], batch["signatures"].get(result["id"]))
+            self._remove_legacy_versions(result["id"], result["metadata"])
+        return batch["pending"]
+    
+    def add_pdf(self, pdf_path, metadata=None, collection_name=None, parsed=None, file_name=None):
+        """
+        PDF'i veritabanına ekler. Sayfalar akış halinde okunur ve parçalara
+        bölünür; parçalar boyutu sınırlı gruplar halinde koleksiyona yazılır.
+        Bellekte bir sayfa ve en fazla bir yazma grubu tutulur; bu yolda
+        çıkarım önbelleği için metin biriktirilmez. Ekleme yarıda kalırsa
+        yazılmış parçalar geri alınır.
+        
+        Her parça yazılırken son metadata'sıyla yazılır, sonradan yeniden
+        yazılmaz. Belgenin tamamına bağlı alanlar ("hash", "chunks",
+        "extraction") yalnızca okuma bittikten sonra yazılan son grubun
+        parçalarında bulunur; belge düzeyindeki değerler katalogdadır.
+        
+        İlk near_duplicate_window karakteri kayıtlı bir belgeninkine
+        near_duplicate_threshold'u geçen oranda benzeyen belgeler (yakın
+        kopyalar) ilk parçalar embed edilmeden yakalanır; near_duplicate_action
+        ayarına göre atlanır ya da metadata'larına "near_duplicate_of" alanı
+        eklenerek işaretlenir. Benzerlik belgenin tamamını değil başını
+        karşılaştırdığından varsayılan işaretlemektir.
+        
+        Aynı dosya (ham hash) akış başlamadan tanınır. Başı kayıtlı bir
+        belgeye benzeyen belgelerin parçaları ise yazılmadan metin hash'i
+        bilinene kadar bellekte tutulur; böylece tam kopyalar yazılıp geri
+        alınmaz, yalnızca tutulan belge için bellekte tüm parçalar bulunur.
+        
+        Kayıtlı bir arXiv makalesinin yeni sürümü eklenirse (aynı sürümsüz
+        ID) parçalar bellekte toplanır ve yalnızca değişenler yazılır
+        (bkz. _upsert_version); sonuçta "updated" alanı bulunur.
+        
+        Args:
+            pdf_path: PDF dosya yolu ya da içeriği (bytes, memoryview, mmap
+                veya dosya benzeri nesne); tampon kaynaklar diske yazılmadan
+                ve kopyalanmadan işlenir
             metadata (dict, optional): Ek metadata bilgileri
             collection_name (str, optional): Kullanılmıyor, geriye dönük uyumluluk için
-            
+            parsed (dict, optional): Daha önce PDFProcessor.parse() ile elde
+                edilmiş sonuç; verilirse PDF yeniden okunmaz
+            file_name (str, optional): Bellekteki kaynaklar için dosya adı
+        
         Returns:
             dict: İşlem sonucu
         """
+        written_ids = []
         try:
-            # PDF işleyici başlat
-            processor = PDFProcessor(pdf_path)
+            processor = PDFProcessor(pdf_path, parsed=parsed, name=file_name)
             
-            # Metin çıkar
-            text = processor.extract_text()
-            if not text or len(text) < 100:
+            # Aynı dosya daha önce eklendiyse PDF'i hiç açmadan dön
+            file_hash = processor.file_hash()
+            duplicate = self._find_registered(file_hash)
+            if duplicate:
+                return duplicate
+            
+            content_hash = hashlib.md5()
+            state = {"size": 0, "first_page": None}
+            if self.clean_pages:
+                source_pages = processor.iter_clean_pages(self.chunker.count_tokens, fill_cache=False)
+            else:
+                source_pages = processor.iter_pages(fill_cache=False)
+            pages = self._iter_tracked_pages(
+                source_pages, content_hash, state, self.near_duplicate_window
+            )
+            
+            simple_metadata = None
+            doc_id = None
+            update = False
+            checked = False  # Yakın kopya kontrolü yapıldı mı
+            hold = False  # Metin hash'i bilinene kadar yazma (olası tam kopya)
+            signature = None
+            buffered = []
+            text_bytes = 0
+            seen = {}
+            batch_limit = self._batch_limit()
+            
+            for chunk in self.chunker.iter_chunks(pages):
+                if simple_metadata is None:
+                    # Metadata hazırla (ilk sayfa okunduktan sonra)
+                    pdf_metadata = processor.build_metadata(state["first_page"])
+                    if metadata:
+                        pdf_metadata.update(metadata)  # Kullanıcının verdiği metadatayı ekle
+                    doc_id, simple_metadata = self._prepare_metadata(processor, pdf_metadata)
+                    
+                    # Aynı ID ile kayıtlı belge varsa yazmaya başlamadan dur,
+                    # daha yeni bir arXiv sürümüyse güncelleme için parçaları topla
+                    duplicate = self._find_duplicate(doc_id=doc_id)
+                    if duplicate:
+                        if not self._is_newer_version(doc_id, simple_metadata):
+                            self.registry.add(file_hash, duplicate["id"])
+                            return duplicate
+                        update = True
+                
+                # İmza penceresi dolunca, ilk grup embed edilmeden yakın kopya ara
+                if not checked and len(state["head"]) >= self.near_duplicate_window:
+                    checked = True
+                    signature, match = self._check_near_duplicate(state["head"], doc_id)
+                    if match:
+                        duplicate = self._near_duplicate_result(match, simple_metadata)
+                        if duplicate:
+                            return duplicate
+                        # Başı kayıtlı bir belgeye benziyor; tam kopya olabilir, yazıp geri almamak için
+                        # parçaları hash bilinene kadar tut
+                        hold = True
+                
+                # Tampon dolunca bir grup yaz; son parça tamponda kalır ki
+                # tek parçalı belgeler ayırt edilebilsin
+                buffered.append(chunk)
+                text_bytes += len(chunk.encode("utf-8"))
+                if checked and not update and not hold and len(buffered) > batch_limit:
+                    start = len(written_ids)
+                    chunk_ids = self._chunk_ids(doc_id, buffered[:batch_limit], seen)
+                    chunk_metadatas = []
+                    for i in range(batch_limit):
+                        chunk_metadata = simple_metadata.copy()
+                        chunk_metadata["chunk"] = start + i  # Daha basit bir isim
+                        chunk_metadatas.append(chunk_metadata)
+                    
+                    self._add_chunks(
+                        documents=buffered[:batch_limit],
+                        metadatas=chunk_metadatas,
+                        ids=chunk_ids
+                    )
+                    written_ids.extend(chunk_ids)
+                    buffered = buffered[batch_limit:]
+            
+            # Boş sayfalardan oluşan belgelerde parça, dolayısıyla metadata da yoktur
+            if processor.error is not None or state["size"] < 100 or simple_metadata is None:
+                self._rollback(written_ids)
                 return {
                     "success": False, 
                     "error": "PDF'den yeterli metin çıkarılamadı.", 
                     "id": None
                 }
             
-            # Metadata hazırla
-            pdf_metadata = processor.extract_metadata()
-            if metadata:
-                pdf_metadata.update(metadata)  # Kullanıcının verdiği metadatayı ekle
-            
             # Dosya içeriğinin hash değeri
-            content_hash = hashlib.md5(text.encode()).hexdigest()
+            content_hash = content_hash.hexdigest()
+            simple_metadata["hash"] = content_hash
             
-            # Sadece gerekli ve basit metadata alanlarını al
-            simple_metadata = {
-                "title": str(pdf_metadata.get("title", ""))[:100],
-                "author": str(pdf_metadata.get("authors", ""))[:100],
-                "source": str(pdf_metadata.get("source", ""))[:20],
-                "hash": content_hash,
-                "file": os.path.basename(pdf_path)
-            }
-            
-            # Benzersiz ID oluştur
-            if "arxiv_id" in pdf_metadata:
-                doc_id = pdf_metadata["arxiv_id"]
-            else:
-                file_name = os.path.basename(pdf_path).replace(".pdf", "")
-                doc_id = f"{file_name}_{content_hash[:8]}"
+            # Sayfa veya süre sınırına takılan belgeleri işaretle
+            if processor.status != "complete":
+                simple_metadata["extraction"] = processor.status
             
             # Duplikasyon kontrolü (hash kullanarak)
-            try:
-                # Hash ile mevcut belgeleri ara
-                results = self.collection.get(
-                    where={"hash": content_hash}
-                )
-                
-                if results and results["ids"]:
-                    return {
-                        "success": False, 
-                        "error": "Bu belge (veya çok benzer içeriğe sahip bir belge) zaten veritabanında mevcut.",
-                        "id": results["ids"][0]
-                    }
-            except Exception as e:
-                print(f"Duplikasyon kontrolü sırasında hata: {e}")
+            duplicate = self._find_duplicate(content_hash=content_hash, exclude_doc_id=doc_id)
+            if duplicate:
+                self._rollback(written_ids)
+                self.registry.add(file_hash, duplicate["id"])
+                return duplicate
             
-            # Metni parçalara böl (gerekirse)
-            max_chunk_size = 8000  # Karakter sayısı
+            # İmza penceresinden kısa belgeler için yakın kopya kontrolü
+            if not checked:
+                signature, match = self._check_near_duplicate(state["head"], doc_id)
+                if match:
+                    duplicate = self._near_duplicate_result(match, simple_metadata)
+                    if duplicate:
+                        return duplicate
             
-            if len(text) > max_chunk_size:
-                chunks = self._chunk_text(text, max_chunk_size)
-                for i, chunk in enumerate(chunks):
-                    chunk_id = f"{doc_id}_chunk_{i}"
-                    chunk_metadata = simple_metadata.copy()
-                    chunk_metadata["chunk"] = i  # Daha basit bir isim
-                    chunk_metadata["chunks"] = len(chunks)  # Daha basit bir isim
-                    
-                    self.collection.add(
-                        documents=[chunk],
-                        metadatas=[chunk_metadata],
-                        ids=[chunk_id]
-                    )
-            else:
-                self.collection.add(
-                    documents=[text],
+            updated = None
+            chunk_count = len(written_ids) + len(buffered)
+            if update:
+                updated = self._upsert_version(doc_id, buffered, simple_metadata)
+            elif not written_ids and len(buffered) == 1:
+                # Tek parçalı belge, doğrudan belge ID'si ile yazılır
+                self._add_chunks(
+                    documents=buffered,
                     metadatas=[simple_metadata],
                     ids=[doc_id]
                 )
+            else:
+                # Son grup (tutulan belgelerde tüm parçalar), artık bilinen toplam
+                # parça sayısı ve hash ile yazılır
+                start = len(written_ids)
+                chunk_metadatas = self._chunk_metadatas(simple_metadata, chunk_count)[start:]
+                chunk_ids = self._chunk_ids(doc_id, buffered, seen)
+                
+                self._write_in_batches(
+                    self._add_chunks,
+                    chunk_ids,
+                    documents=buffered,
+                    metadatas=chunk_metadatas
+                )
+                written_ids.extend(chunk_ids)
+            
+            self.registry.add(file_hash, doc_id)
+            self._catalog_document(doc_id, simple_metadata, chunk_count, text_bytes)
+            self._index_signature(doc_id, signature)
+            self._remove_legacy_versions(doc_id, simple_metadata)
+            
+            cleanup = self._cleanup_report(processor, self.chunker)
+            if cleanup:
+                print(f"Temizleme ({doc_id}): {cleanup['chars_saved']} karakter, ~{cleanup['chunks_saved']} parça atlandı")
             
             return {
                 "success": True, 
                 "id": doc_id, 
-                "metadata": simple_metadata
+                "metadata": simple_metadata,
+                "extraction_status": processor.status,
+                "pages": processor.page_count,
+                "cleanup": cleanup,
+                "chunks": chunk_count,
+                "updated": updated
             }
         
         except Exception as e:
             print(f"PDF ekleme hatası: {e}")
+            self._rollback(written_ids)
             return {
                 "success": False, 
                 "error": str(e), 
                 "id": None
             }
     
-    def search(self, query, n_results=5, collection_name=None, filter_query=None):
+    def _rollback(self, ids):
+        """
+        Yarıda kalan bir ekleme işleminde yazılmış parçaları geri alır.
+        
+        Args:
+            ids (list): Silinecek ID'ler
+        """
+        if not ids:
+            return
+        try:
+            self.collection.delete(ids=ids)
+            self.lexical_index.remove(ids)
+        except Exception as e:
+            print(f"Geri alma hatası: {e}")
+        finally:
+            self.query_cache.bump()
+    
+    def add_pdfs(self, pdf_paths, metadatas=None, workers=None, progress_callback=None,
+                 batch_across_documents=True):
+        """
+        Birden çok PDF'i veritabanına ekler. Daha önce eklenmiş dosyalar ham
+        hash dizininden tanınır ve açılmadan atlanır. Metin çıkarma ve
+        parçalama işlemci çekirdeklerine dağıtılmış bir süreç havuzunda
+        yapılır; sırayla yapılan tek aşama koleksiyona yazmadır.
+        
+        Args:
+            pdf_paths (list): PDF dosya yolları
+            metadatas (list, optional): Her PDF için ek metadata (aynı sırada)
+            workers (int, optional): Süreç sayısı, None ise işlemci sayısı
+            progress_callback (callable, optional): Her dosya bittiğinde
+                progress_callback(tamamlanan, toplam, sonuç) şeklinde çağrılır
+            batch_across_documents (bool): True ise birden çok belgenin
+                parçaları aynı yazma grubunda birleştirilir (en fazla
+                write_batch_size parça), False ise her belge ayrı yazılır
+        
+        Returns:
+            list: Her dosya için add_pdf ile aynı biçimde sonuç (girdi sırasıyla),
+                "file" alanında dosya yolu
+        """
+        pdf_paths = list(pdf_paths)
+        total = len(pdf_paths)
+        metadatas = list(metadatas) if metadatas else [None] * total
+        workers = workers or os.cpu_count() or 1
+        results = [None] * total
+        completed = 0
+        batch = self._new_batch()
+        batch_limit = self._batch_limit()
+        file_hashes = {}
+        
+        def finish(index, result):
+            nonlocal completed
+            # Yalnızca eklenen ve aynısı kayıtlı olan dosyaları dizine yaz; yakın
+            # kopya ve hata sonuçlarında belge ID'si yoktur
+            if result["id"] is not None and file_hashes.get(index):
+                self.registry.add(file_hashes[index], result["id"])
+            result["file"] = pdf_paths[index]
+            results[index] = result
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, result)
+        
+        # Bellekte bekleyen sonuçları sınırlamak için havuza kademeli iş ver
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            next_index = 0
+            while next_index < total or futures:
+                while next_index < total and len(futures) < workers * 2:
+                    index = next_index
+                    next_index += 1
+                    
+                    file_hashes[index] = self._file_hash(pdf_paths[index])
+                    duplicate = self._find_registered(file_hashes[index])
+                    if duplicate:
+                        finish(index, duplicate)
+                        continue
+                    
+                    future = executor.submit(
+                        _extract_for_ingest,
+                        pdf_paths[index],
+                        metadatas[index],
+                        self.chunker,
+                        self.clean_pages,
+                        {
+                            "cache": PDFProcessor.cache,
+                            "max_pages": PDFProcessor.max_pages,
+                            "timeout": PDFProcessor.timeout
+                        },
+                        self.near_duplicate_window
+                    )
+                    futures[future] = index
+                
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        result = self._stage_document(future.result(), batch)
+                    except Exception as e:
+                        print(f"PDF ekleme hatası ({pdf_paths[index]}): {e}")
+                        result = {"success": False, "error": str(e), "id": None}
+                    
+                    if not result["success"] or result.get("updated"):
+                        finish(index, result)
+                        continue
+                    
+                    batch["pending"].append((index, result))
+                    if not batch_across_documents or len(batch["ids"]) >= batch_limit:
+                        for index, result in self._flush_batch(batch):
+                            finish(index, result)
+                        batch = self._new_batch()
+        
+        # Kalan parçaları yaz
+        if batch["pending"]:
+            for index, result in self._flush_batch(batch):
+                finish(index, result)
+        
+        return results
+    
+    def search(self, query, n_results=5, collection_name=None, filter_query=None,
+               include=None, snippet_chars=None, mode="vector"):
         """
-        Veritabanında arama yapar.
+        Veritabanında arama yapar. Aynı sorgu, sonuç sayısı ve filtre için
+        sonuç, koleksiyon değişmediği sürece önbellekten döner (bkz. QueryCache).
+        
+        Arama türleri:
+            "vector": Yalnızca vektör benzerliği.
+            "hybrid": Vektör ve BM25 sıralamaları RRF ile birleştirilir;
+                "scores" alanında birleşik puan bulunur, yalnızca kelime
+                dizininden gelen parçaların uzaklığı None olur.
+            "lexical": Yalnızca BM25; sorgu vektöre çevrilmez. "distances"
+                yerine "scores" alanında BM25 puanı döner.
         
         Args:
             query (str): Arama sorgusu
             n_results (int): Dönecek maksimum sonuç sayısı
             collection_name (str, optional): Kullanılmıyor
-            filter_query (dict, optional): Filtreleme kriterleri
-            
+            filter_query (dict veya SearchFilter, optional): Filtreleme
+                kriterleri; arama sırasında dizinde uygulanır
+            include (list, optional): Döndürülecek alanlar ("documents",
+                "metadatas", "distances"); None ise hepsi
+            snippet_chars (int, optional): Verilirse "documents" alanında
+                parçanın tamamı yerine sorguyla en çok örtüşen cümlenin
+                çevresindeki en fazla bu kadar karakter döner; "snippets"
+                alanında parçadaki başlangıç ve bitiş konumları bulunur. Tam
+                metin gerektiğinde get_chunk_texts ile alınır.
+            mode (str): Arama türü ("vector", "hybrid" veya "lexical")
+        
         Returns:
             dict: Arama sonuçları
         """
+        if mode not in ("vector", "hybrid", "lexical"):
+            raise ValueError(f"Geçersiz arama türü: {mode}")
+        include = list(include) if include is not None else ["documents", "metadatas", "distances"]
+        filter_query = self._where(filter_query)
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                where=filter_query,
-                n_results=n_results
+            cache_key = self.query_cache.key(
+                "search", query, n_results, filter_query or None, sorted(include), snippet_chars, mode
             )
+            results, generation = self.query_cache.get(cache_key)
+            if results is not None:
+                return results
             
+            query_include = list(include)
+            if snippet_chars and "documents" not in query_include:
+                query_include.append("documents")
+            
+            if mode == "vector":
+                results = self.collection.query(
+                    query_texts=[query],
+                    where=filter_query,
+                    n_results=n_results,
+                    include=query_include
+                )
+            else:
+                results = self._ranked_search(query, n_results, filter_query, query_include, mode)
+            
+            if snippet_chars:
+                snippets = [_snippet(document, query, snippet_chars) for document in results["documents"][0]]
+                results["documents"] = [[text for text, _, _ in snippets]]
+                results["snippets"] = [[{"start": start, "end": end} for _, start, end in snippets]]
+            
+            # Chroma istenmeyen alanları None olarak döndürür
+            results = {name: value for name, value in results.items() if value is not None}
+            
+            self.query_cache.put(cache_key, results, generation)
             return results
         except Exception as e:
             print(f"Arama hatası: {e}")
             return {"ids": [], "documents": [[]], "metadatas": [[]], "distances": [[]]}
     
-    def get_all_documents(self, collection_name=None, limit=100, offset=0):
+    @staticmethod
+    def _where(filter_query):
+        """
+        Filtreyi Chroma'nın where ifadesine çevirir.
+        
+        Args:
+            filter_query (dict veya SearchFilter): Filtre veya None
+        
+        Returns:
+            dict: where ifadesi; filtre boşsa None
+        """
+        if isinstance(filter_query, SearchFilter):
+            return filter_query.build()
+        return filter_query or None
+    
+    def _ranked_search(self, query, n_results, filter_query, include, mode):
         """
-        Koleksiyondaki tüm belgeleri döndürür.
+        Karma ve kelime aramasını yapar. Her iki sıralamadan da n_results'tan
+        geniş bir aday listesi alınır; karma aramada bir parçanın puanı
+        bulunduğu her sıralama için 1 / (rrf_k + sıra) toplamıdır. Metin ve
+        metadata yalnızca seçilen parçalar için tek bir get çağrısıyla okunur;
+        metadata filtresi de bu çağrıda uygulanır.
+        
+        Args:
+            query (str): Arama sorgusu
+            n_results (int): Dönecek maksimum sonuç sayısı
+            filter_query (dict): Filtreleme kriterleri veya None
+            include (list): Döndürülecek alanlar
+            mode (str): "hybrid" veya "lexical"
+        
+        Returns:
+            dict: search ile aynı biçimde sonuçlar ve "scores" alanı
+        """
+        # Filtre kelime dizininde uygulanamadığından filtreli aramada daha çok aday al
+        candidates = max(n_results * (10 if filter_query else 4), 20)
+        lexical = self.lexical_index.search(query, candidates)
+        
+        distances = {}
+        if mode == "hybrid":
+            vector = self.collection.query(
+                query_texts=[query],
+                where=filter_query,
+                n_results=candidates,
+                include=["distances"]
+            )
+            distances = dict(zip(vector["ids"][0], vector["distances"][0]))
+            scores = {}
+            for ranking in (vector["ids"][0], [chunk_id for chunk_id, _ in lexical]):
+                for rank, chunk_id in enumerate(ranking, start=1):
+                    scores[chunk_id] = scores.get(chunk_id, 0) + 1 / (self.rrf_k + rank)
+        else:
+            scores = dict(lexical)
+        
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        fields = [name for name in include if name in ("documents", "metadatas")]
+        found = {"ids": []}
+        if ranked:
+            found = self.collection.get(ids=ranked, where=filter_query, include=fields)
+        positions = {chunk_id: i for i, chunk_id in enumerate(found["ids"])}
+        ids = [chunk_id for chunk_id in ranked if chunk_id in positions][:n_results]
+        
+        results = {"ids": [ids], "scores": [[scores[chunk_id] for chunk_id in ids]]}
+        for name in fields:
+            results[name] = [[found[name][positions[chunk_id]] for chunk_id in ids]]
+        if mode == "hybrid" and "distances" in include:
+            results["distances"] = [[distances.get(chunk_id) for chunk_id in ids]]
+        return results
+    
+    def get_chunk_texts(self, ids):
+        """
+        Parçaların tam metnini ID ile getirir (ör. snippet_chars ile yapılan
+        aramadan sonra yalnızca gerekli parçalar için).
+        
+        Args:
+            ids (list): Parça ID'leri
+        
+        Returns:
+            dict: Parça ID'si -> metin; bulunmayan ID'ler yer almaz
+        """
+        if not ids:
+            return {}
+        try:
+            found = self.collection.get(ids=list(ids), include=["documents"])
+            return dict(zip(found["ids"], found["documents"]))
+        except Exception as e:
+            print(f"Parça metni alma hatası: {e}")
+            return {}
+    
+    def search_many(self, queries, n_results=5, filter_query=None):
+        """
+        Birden çok sorguyu tek seferde arar: önbellekte olmayan sorgular tek
+        bir embedding çağrısıyla vektöre çevrilir ve tek bir collection.query
+        çağrısıyla aranır. Sonuçlar her sorgu için ana belgeye göre
+        gruplanmış olarak döner.
+        
+        Args:
+            queries (list): Arama sorguları
+            n_results (int): Sorgu başına dönecek maksimum parça sayısı
+            filter_query (dict veya SearchFilter, optional): Filtreleme kriterleri
+        
+        Returns:
+            list: Her sorgu için (aynı sırada) _group_by_document çıktısı
+        """
+        queries = list(queries)
+        filter_query = self._where(filter_query)
+        results = [None] * len(queries)
+        keys = [self.query_cache.key("search_many", query, n_results, filter_query or None) for query in queries]
+        
+        missing = []
+        generation = None
+        for i, key in enumerate(keys):
+            results[i], generation_i = self.query_cache.get(key)
+            if results[i] is None:
+                missing.append(i)
+                generation = generation_i if generation is None else min(generation, generation_i)
+        
+        if not missing:
+            return results
+        
+        try:
+            found = self.collection.query(
+                query_embeddings=self.embedding_function([queries[i] for i in missing]),
+                where=filter_query,
+                n_results=n_results
+            )
+        except Exception as e:
+            print(f"Arama hatası: {e}")
+            for i in missing:
+                results[i] = []
+            return results
+        
+        for position, i in enumerate(missing):
+            results[i] = self._group_by_document(
+                found["ids"][position],
+                found["documents"][position],
+                found["metadatas"][position],
+                found["distances"][position]
+            )
+            self.query_cache.put(keys[i], results[i], generation)
+        return results
+    
+    @staticmethod
+    def _group_by_document(ids, documents, metadatas, distances):
+        """
+        Tek bir sorgunun parça sonuçlarını ana belgeye göre gruplar. Belgeler
+        en iyi parçalarının sırasına göre, parçalar uzaklık sırasıyla listelenir.
+        
+        Args:
+            ids (list): Parça ID'leri
+            documents (list): Parça metinleri
+            metadatas (list): Parça metadata'ları
+            distances (list): Sorguya uzaklıklar
+        
+        Returns:
+            list: Her belge için "id", "metadata", "distance" (en iyi parçanın
+                uzaklığı) ve "chunks" ((ID, metin, uzaklık) listesi) alanları
+        """
+        groups = {}
+        for chunk_id, document, metadata, distance in zip(ids, documents, metadatas, distances):
+            metadata = metadata or {}
+            doc_id = metadata.get("doc_id") or chunk_id.split('_chunk_')[0]
+            if doc_id not in groups:
+                groups[doc_id] = {
+                    "id": doc_id,
+                    "metadata": metadata,
+                    "distance": distance,
+                    "chunks": []
+                }
+            groups[doc_id]["chunks"].append((chunk_id, document, distance))
+        return list(groups.values())
+    
+    def get_all_documents(self, collection_name=None, limit=100, offset=0,
+                          order_by="added_at", descending=True):
+        """
+        Koleksiyondaki belgeleri katalogdan sayfalı olarak döndürür; koleksiyon
+        taranmaz, maliyet sayfa boyutuyla orantılıdır.
         
         Args:
             collection_name (str, optional): Kullanılmıyor
             limit (int): Maksimum belge sayısı
             offset (int): Başlangıç indeksi
-            
+            order_by (str): Sıralama alanı ("added_at", "title", "author",
+                "source" veya "chunk_count")
+            descending (bool): Azalan sıralama
+        
         Returns:
-            dict: Belge listesi
+            dict: Belge listesi ("ids", "metadatas", "total"); metadata'da
+                parça sayısı ("chunks") ve eklenme zamanı ("added_at") bulunur
         """
         try:
-            # Tüm belgeleri al
-            results = self.collection.get()
-            
-            # Chunk'ları grupla ve ana belgeleri bul
-            main_documents = {}
-            for i, (doc_id, metadata) in enumerate(zip(results["ids"], results["metadatas"])):
-                if '_chunk_' in doc_id:
-                    main_id = doc_id.split('_chunk_')[0]
-                    if main_id not in main_documents:
-                        main_documents[main_id] = {
-                            'id': main_id,
-                            'metadata': metadata.copy(),
-                            'chunks': []
-                        }
-                    main_documents[main_id]['chunks'].append(doc_id)
-                else:
-                    main_documents[doc_id] = {
-                        'id': doc_id,
-                        'metadata': metadata,
-                        'chunks': []
-                    }
-            
-            # Ana belge listesini oluştur
-            main_doc_list = list(main_documents.values())
-            total_count = len(main_doc_list)
-            
-            # Sayfalama uygula
-            start_idx = offset
-            end_idx = min(offset + limit, total_count)
-            paginated_docs = main_doc_list[start_idx:end_idx]
-            
-            # Sonuçları hazırla
+            documents = self.catalog.list(
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                descending=descending
+            )
             return {
-                "ids": [doc['id'] for doc in paginated_docs],
-                "metadatas": [doc['metadata'] for doc in paginated_docs],
-                "total": total_count
+                "ids": [doc_id for doc_id, _ in documents],
+                "metadatas": [metadata for _, metadata in documents],
+                "total": self.catalog.count()
             }
-            
+        
         except Exception as e:
             print(f"Belgeleri alma hatası: {e}")
             return {"ids": [], "metadatas": [], "total": 0}
     
+    def latest(self, n=5):
+        """
+        En son eklenen belgeleri döndürür. Katalogdaki eklenme zamanı
+        dizininden okunur; maliyet koleksiyon boyutundan bağımsızdır.
+        
+        Args:
+            n (int): Belge sayısı
+        
+        Returns:
+            dict: "ids" ve "metadatas" alanları, yeniden eskiye sıralı
+        """
+        try:
+            documents = self.catalog.list(limit=n, order_by="added_at", descending=True)
+            return {
+                "ids": [doc_id for doc_id, _ in documents],
+                "metadatas": [metadata for _, metadata in documents]
+            }
+        except Exception as e:
+            print(f"Son belgeleri alma hatası: {e}")
+            return {"ids": [], "metadatas": []}
+    
+    def rebuild_catalog(self):
+        """
+        Kataloğu ve istatistik sayaçlarını koleksiyondaki parçalardan baştan
+        oluşturur. Katalogdan önce eklenmiş belgeler veya katalog dışında
+        değiştirilmiş koleksiyonlar için kullanılır; tüm koleksiyonu sayfa
+        sayfa tarar, bellekte parçalar değil yalnızca belge özetleri tutulur.
+        
+        Returns:
+            int: Katalogdaki belge sayısı
+        """
+        fields = ("doc_id", "title", "author", "source", "file", "arxiv_id", "added_at")
+        documents = {}
+        for chunk_id, metadata, text in self._iter_collection(include=("metadatas", "documents"), fields=fields):
+            doc_id = metadata.get("doc_id") or chunk_id.split('_chunk_')[0]
+            if doc_id not in documents:
+                documents[doc_id] = [doc_id, metadata, 0, 0, metadata.get("added_at")]
+            documents[doc_id][2] += 1
+            documents[doc_id][3] += _text_bytes([text or ""])
+        
+        self.catalog.replace_all(documents.values())
+        print(f"Katalog yeniden oluşturuldu: {len(documents)} belge")
+        return len(documents)
+    
+    def rebuild_lexical_index(self, page_size=1000):
+        """
+        Kelime dizinini koleksiyondaki parçalardan baştan oluşturur. Dizinden
+        önce eklenmiş belgeler veya dizin dışında değiştirilmiş koleksiyonlar
+        için kullanılır; koleksiyon sayfa sayfa taranır.
+        
+        Args:
+            page_size (int): Dizine tek seferde yazılan parça sayısı
+        
+        Returns:
+            int: Dizindeki parça sayısı
+        """
+        self.lexical_index.clear()
+        page = ([], [], [])
+        for chunk_id, metadata, text in self._iter_collection(
+            include=("metadatas", "documents"), fields=("doc_id",), page_size=page_size
+        ):
+            page[0].append(chunk_id)
+            page[1].append(metadata.get("doc_id") or chunk_id.split('_chunk_')[0])
+            page[2].append(text or "")
+            if len(page[0]) >= page_size:
+                self.lexical_index.add(*page)
+                page = ([], [], [])
+        if page[0]:
+            self.lexical_index.add(*page)
+        
+        self.query_cache.bump()
+        count = self.lexical_index.count()
+        print(f"Kelime dizini yeniden oluşturuldu: {count} parça")
+        return count
+    
     def delete_document(self, doc_id, collection_name=None):
         """
         Belgeyi veritabanından siler.
@@ -303,45 +1686,88 @@ class ChromaManager:
         Args:
             doc_id (str): Silinecek belge ID'si
             collection_name (str, optional): Kullanılmıyor
-            
+        
         Returns:
             bool: Başarı durumu
         """
-        try:
-            # Tüm belgeleri al
-            all_results = self.collection.get()
-            
-            # Chunk ID'lerini bul
-            chunk_ids = [id for id in all_results["ids"] 
-                       if id.startswith(f"{doc_id}_chunk_")]
-            
-            # Önce chunk'ları sil
-            if chunk_ids:
-                print(f"Silinecek chunk'lar: {chunk_ids}")
-                self.collection.delete(ids=chunk_ids)
-            
-            # Son olarak ana belgeyi sil
-            print(f"Ana belge siliniyor: {doc_id}")
-            self.collection.delete(ids=[doc_id])
-            
-            # Silme işleminin başarılı olduğunu kontrol et
-            verify_result = self.collection.get(ids=[doc_id])
-            if not verify_result["ids"]:
-                return True
+        return self.delete_documents([doc_id])
+    
+    def _legacy_chunk_ids(self, doc_ids):
+        """
+        doc_id metadata alanı olmayan eski kayıtların ID'lerini bulur (belge
+        ID'si veya sıra numaralı "{doc_id}_chunk_{i}" parçaları).
+        
+        Args:
+            doc_ids (list): Belge ID'leri
+        
+        Returns:
+            list: Koleksiyonda bulunan eski kayıt ID'leri
+        """
+        found = self.collection.get(
+            ids=doc_ids + [f"{doc_id}_chunk_0" for doc_id in doc_ids],
+            include=["metadatas"]
+        )
+        
+        candidates = []
+        for found_id, metadata in zip(found["ids"], found["metadatas"]):
+            metadata = metadata or {}
+            if "doc_id" in metadata:
+                continue
+            if found_id.endswith("_chunk_0"):
+                base_id = found_id[:-len("_chunk_0")]
+                candidates.extend(f"{base_id}_chunk_{i}" for i in range(metadata.get("chunks", 1)))
             else:
-                print("Belge silme doğrulaması başarısız")
-                return False
+                candidates.append(found_id)
+        
+        if not candidates:
+            return []
+        return self.collection.get(ids=candidates, include=[])["ids"]
+    
+    def delete_documents(self, doc_ids, collection_name=None):
+        """
+        Belgeleri ve tüm parçalarını siler. Parçalar doc_id metadata alanıyla
+        seçilir; koleksiyon taranmaz ve her 500 belge için tek bir silme
+        çağrısı yapılır. doc_id alanı olmayan eski kayıtlar ID ile silinir.
+        
+        Args:
+            doc_ids (list): Silinecek belge ID'leri
+            collection_name (str, optional): Kullanılmıyor
+        
+        Returns:
+            bool: Başarı durumu
+        """
+        doc_ids = list(dict.fromkeys(doc_ids))
+        try:
+            for start in range(0, len(doc_ids), 500):
+                group = doc_ids[start:start + 500]
+                legacy_ids = self._legacy_chunk_ids(group)
+                
+                self.collection.delete(where={"doc_id": {"$in": group}})
+                if legacy_ids:
+                    self.collection.delete(ids=legacy_ids)
                 
+                self.registry.remove_documents(group)
+                self.catalog.remove_many(group)
+                self.near_duplicates.remove_many(group)
+                self.lexical_index.remove_documents(group)
+                print(f"{start + len(group)}/{len(doc_ids)} belge silindi")
+            return True
+        
         except Exception as e:
             print(f"Silme hatası: {e}")
             return False
+        finally:
+            self.query_cache.bump()
     
     def get_stats(self):
         """
-        Veritabanı istatistiklerini döndürür.
+        Veritabanı istatistiklerini döndürür. Değerler katalogda ekleme ve
+        silme sırasında güncellenen sayaçlardan okunur, koleksiyon taranmaz;
+        sayaçlar rebuild_catalog ile koleksiyondan yeniden hesaplanabilir.
         
         Returns:
-            dict: İstatistikler
+            dict: İstatistikler ("total_docs", "total_chunks", "text_bytes",
+                "sources", "collection_stats", "embedding_cache", "query_cache")
         """
         stats = {
             "total_docs": 0,
@@ -350,23 +1776,144 @@ class ChromaManager:
         }
         
         try:
-            # Tüm belgeleri al
-            results = self.collection.get()
-            
-            # Chunk'ları grupla ve ana belgeleri say
-            main_documents = set()
-            for doc_id in results["ids"]:
-                if '_chunk_' in doc_id:
-                    main_id = doc_id.split('_chunk_')[0]
-                    main_documents.add(main_id)
-                else:
-                    main_documents.add(doc_id)
-            
-            stats["total_docs"] = len(main_documents)
+            counters = self.catalog.stats()
+            stats["total_docs"] = counters["documents"]
+            stats["total_chunks"] = counters["chunks"]
+            stats["text_bytes"] = counters["text_bytes"]
+            stats["sources"] = counters["sources"]
             stats["collection_stats"][self.collection_name] = {
-                "count": len(main_documents)
+                "count": counters["documents"],
+                "chunks": counters["chunks"]
             }
+            stats["embedding_cache"] = self.embedding_cache.stats()
+            stats["query_cache"] = self.query_cache.stats()
         except Exception as e:
             print(f"İstatistik hatası: {e}")
         
-        return stats
\ No newline at end of file
+        return stats
+
+
+def _extract_for_ingest(pdf_path, metadata, chunker, clean_pages=True, processor_options=None,
+                        head_chars=0):
+    """
+    Süreç havuzunda çalışır: PDF'den metni çıkarır, parçalar ve koleksiyona
+    yazılmaya hazır hale getirir.
+    
+    Args:
+        pdf_path (str): PDF dosya yolu
+        metadata (dict): Ek metadata bilgileri
+        chunker (TokenChunker): Parçalayıcı
+        clean_pages (bool): Sayfalar PageCleaner'dan geçirilsin mi
+        processor_options (dict, optional): Ana süreçteki PDFProcessor
+            ayarları (cache, max_pages, timeout)
+        head_chars (int): Yakın kopya imzası için saklanacak baştaki karakter
+    
+    Returns:
+        dict: "id", "metadata", "hash", "chunks", "head", "status", "pages"
+            ve "cleanup" alanları; hata varsa "error"
+    """
+    try:
+        processor = PDFProcessor(pdf_path, **(processor_options or {}))
+        content_hash = hashlib.md5()
+        state = {"size": 0, "first_page": None}
+        if clean_pages:
+            source_pages = processor.iter_clean_pages(chunker.count_tokens)
+        else:
+            source_pages = processor.iter_pages()
+        pages = ChromaManager._iter_tracked_pages(source_pages, content_hash, state, head_chars)
+        chunks = list(chunker.iter_chunks(pages))
+        
+        # Boş sayfalardan oluşan belgeler yeterli boyutta olsa da parça üretmez
+        if processor.error is not None or state["size"] < 100 or not chunks:
+            return {"error": "PDF'den yeterli metin çıkarılamadı."}
+        
+        pdf_metadata = processor.build_metadata(state["first_page"])
+        if metadata:
+            pdf_metadata.update(metadata)  # Kullanıcının verdiği metadatayı ekle
+        doc_id, simple_metadata = ChromaManager._prepare_metadata(processor, pdf_metadata)
+        
+        return {
+            "id": doc_id,
+            "metadata": simple_metadata,
+            "hash": content_hash.hexdigest(),
+            "chunks": chunks,
+            "head": state["head"],
+            "status": processor.status,
+            "pages": processor.page_count,
+            "cleanup": ChromaManager._cleanup_report(processor, chunker)
+        }
+    except Exception as e:
+        print(f"PDF işleme hatası ({pdf_path}): {e}")
+        return {"error": str(e)}
+
+
+def _text_bytes(chunks):
+    """
+    Parça metinlerinin toplam UTF-8 boyutu.
+    
+    Args:
+        chunks (list): Parça metinleri
+    
+    Returns:
+        int: Bayt sayısı
+    """
+    return sum(len(chunk.encode("utf-8")) for chunk in chunks)
+
+
+def _snippet(text, query, max_chars):
+    """
+    Metinden sorgu kelimeleriyle en çok örtüşen cümlenin çevresindeki en
+    fazla max_chars karakterlik pencereyi döndürür.
+    
+    Args:
+        text (str): Parça metni
+        query (str): Arama sorgusu
+        max_chars (int): Pencere boyutu
+    
+    Returns:
+        tuple: (pencere metni, başlangıç, bitiş); konumlar text içindedir
+    """
+    text = text or ""
+    if len(text) <= max_chars:
+        return text, 0, len(text)
+    
+    terms = set(re.findall(r"\w+", query.lower()))
+    best_start, best_end, best_score = 0, 0, -1
+    for match in re.finditer(r"[^.!?]+[.!?]*", text):
+        score = sum(1 for word in re.findall(r"\w+", match.group().lower()) if word in terms)
+        if score > best_score:
+            best_start, best_end, best_score = match.start(), match.end(), score
+    
+    # Cümleyi pencerenin ortasına al, metnin sınırlarına kaydır
+    padding = max((max_chars - (best_end - best_start)) // 2, 0)
+    start = max(best_start - padding, 0)
+    end = min(start + max_chars, len(text))
+    start = max(end - max_chars, 0)
+    return text[start:end], start, end
+
+
+def _arxiv_base(arxiv_id):
+    """
+    arXiv ID'sinden sürüm ekini atar ("2401.01234v2" -> "2401.01234").
+    
+    Args:
+        arxiv_id (str): arXiv ID'si
+    
+    Returns:
+        str: Sürümsüz ID
+    """
+    return re.sub(r"v\d+$", "", arxiv_id)
+
+
+def _arxiv_version(arxiv_id):
+    """
+    arXiv ID'sinin sürüm numarasını döndürür; sürüm eki yoksa 0.
+    
+    Args:
+        arxiv_id (str): arXiv ID'si
+    
+    Returns:
+        int: Sürüm numarası
+    """
+    match = re.search(r"v(\d+)$", arxiv_id)
+    return int(match.group(1)) if match else 0
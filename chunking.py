@@ -0,0 +1,205 @@
+import re
+
+class WordTokenCounter:
+    """
+    Kelime ve noktalama işaretlerini token sayan basit sayaç. Tokenizer'ı
+    olmayan embedding fonksiyonları için kullanılır.
+    """
+    
+    def __call__(self, text):
+        """
+        Args:
+            text (str): Metin
+        
+        Returns:
+            int: Token sayısı
+        """
+        return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+class TokenizerTokenCounter:
+    def __init__(self, tokenizer_file):
+        """
+        Modelin kendi tokenizer'ıyla token sayan sayaç. Tokenizer ilk
+        kullanımda yüklenir; nesne süreç havuzuna yalnızca dosya yolu ile
+        aktarılır.
+        
+        Args:
+            tokenizer_file (str): HuggingFace tokenizer.json dosyası
+        """
+        self.tokenizer_file = tokenizer_file
+        self._tokenizer = None
+    
+    def __getstate__(self):
+        return {"tokenizer_file": self.tokenizer_file, "_tokenizer": None}
+    
+    def __call__(self, text):
+        """
+        Args:
+            text (str): Metin
+        
+        Returns:
+            int: Özel tokenlar ([CLS], [SEP]) hariç token sayısı
+        """
+        if self._tokenizer is None:
+            from tokenizers import Tokenizer
+            self._tokenizer = Tokenizer.from_file(self.tokenizer_file)
+            self._tokenizer.no_truncation()
+            self._tokenizer.no_padding()
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def iter_sentences(pages, max_pending=10000):
+    """
+    Sayfa metinlerini akış halinde cümlelere böler. Sayfa sonunda yarım
+    kalan cümle bir sonraki sayfayla birleştirilir.
+    
+    Args:
+        pages (iterable): Sayfa metinleri
+        max_pending (int): Yarım cümle tamponunun karakter sınırı
+    
+    Yields:
+        str: Cümle
+    """
+    pending = ""
+    for page_text in pages:
+        sentences = re.split(r'(?<=[.!?])\s+', pending + page_text)
+        pending = sentences.pop()
+        yield from sentences
+        
+        # Noktalama içermeyen çok uzun metinde tamponun büyümesini engelle
+        if len(pending) > max_pending:
+            yield pending
+            pending = ""
+    
+    if pending:
+        yield pending
+
+
+class TokenChunker:
+    def __init__(self, max_tokens=256, overlap=32, count_tokens=None):
+        """
+        Metni embedding modelinin token penceresine sığan parçalara böler.
+        Parçalar cümle sınırlarından bölünür; ardışık parçalar, bir parçanın
+        son cümlelerini (en fazla overlap token) bir sonrakinin başında
+        tekrar ederek bağlamı korur.
+        
+        Args:
+            max_tokens (int): Parça başına en fazla token
+            overlap (int): Ardışık parçalar arasında tekrarlanan en fazla token
+            count_tokens (callable, optional): Metnin token sayısını döndürür;
+                None ise WordTokenCounter kullanılır
+        """
+        if overlap >= max_tokens:
+            raise ValueError("overlap, max_tokens değerinden küçük olmalı.")
+        self.max_tokens = max_tokens
+        self.overlap = overlap
+        self.count_tokens = count_tokens or WordTokenCounter()
+    
+    @classmethod
+    def for_embedding(cls, embedding_function, overlap=32):
+        """
+        Sınırı ve token sayacı embedding fonksiyonundan alınan bir parçalayıcı
+        oluşturur (max_tokens özelliği ve token_counter() metodu).
+        
+        Args:
+            embedding_function: Embedding fonksiyonu
+            overlap (int): Ardışık parçalar arasında tekrarlanan en fazla token
+        
+        Returns:
+            TokenChunker: Parçalayıcı
+        """
+        max_tokens = getattr(embedding_function, "max_tokens", 256)
+        token_counter = getattr(embedding_function, "token_counter", None)
+        return cls(
+            max_tokens=max_tokens,
+            overlap=min(overlap, max_tokens // 2),
+            count_tokens=token_counter() if token_counter else None
+        )
+    
+    def chunk_text(self, text):
+        """
+        Metni parçalara böler.
+        
+        Args:
+            text (str): Bölünecek metin
+        
+        Returns:
+            list: Metin parçalarının listesi
+        """
+        return list(self.iter_chunks([text]))
+    
+    def _split_long(self, sentence):
+        """
+        Tek başına sınırı aşan bir cümleyi kelime sınırlarından böler.
+        
+        Args:
+            sentence (str): Cümle
+        
+        Yields:
+            str: Metin parçası
+        """
+        words = []
+        size = 0
+        for word in sentence.split():
+            word_size = self.count_tokens(word)
+            if words and size + word_size > self.max_tokens:
+                yield ' '.join(words)
+                words = []
+                size = 0
+            words.append(word)
+            size += word_size
+        
+        if words:
+            yield ' '.join(words)
+    
+    def iter_chunks(self, pages):
+        """
+        Sayfa metinlerinden akış halinde parçalar üretir. Bellekte en fazla
+        bir parça ve bir sayfa tutulur.
+        
+        Args:
+            pages (iterable): Sayfa metinleri
+        
+        Yields:
+            str: Metin parçası
+        """
+        window = []  # (cümle, token sayısı) çiftleri
+        size = 0
+        fresh = False  # Pencerede henüz üretilmemiş cümle var mı
+        
+        for sentence in iter_sentences(pages):
+            if not sentence.strip():
+                continue
+            sentence_size = self.count_tokens(sentence)
+            
+            # Tek başına sınırı aşan cümle kelimelere bölünür, bağlam taşınmaz
+            if sentence_size > self.max_tokens:
+                if fresh:
+                    yield ' '.join(text for text, _ in window)
+                yield from self._split_long(sentence)
+                window, size, fresh = [], 0, False
+                continue
+            
+            if size + sentence_size > self.max_tokens:
+                if fresh:
+                    yield ' '.join(text for text, _ in window)
+                
+                # Son cümleleri örtüşme olarak bir sonraki parçaya taşı
+                kept = []
+                kept_size = 0
+                for text, text_size in reversed(window):
+                    if kept_size + text_size > self.overlap:
+                        break
+                    kept.insert(0, (text, text_size))
+                    kept_size += text_size
+                while kept and kept_size + sentence_size > self.max_tokens:
+                    kept_size -= kept.pop(0)[1]
+                window, size = kept, kept_size
+            
+            window.append((sentence, sentence_size))
+            size += sentence_size
+            fresh = True
+        
+        if fresh:
+            yield ' '.join(text for text, _ in window)
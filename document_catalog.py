@@ -0,0 +1,292 @@
+import time
+from sqlite_store import connect, database_file
+
+class DocumentCatalog:
+    # Sıralamada kullanılabilecek sütunlar
+    SORT_COLUMNS = ("added_at", "title", "author", "source", "chunk_count")
+    
+    def __init__(self, db_path):
+        """
+        Koleksiyondaki belgelerin (parçalar değil) yerel kataloğu.
+        
+        Her belge için tek satır tutulur: başlık, yazar, kaynak, dosya, parça
+        sayısı, metin boyutu ve eklenme zamanı. Satırlar belge eklenirken ve
+        silinirken güncellenir; listeleme, sayfalama ve sıralama koleksiyonu
+        taramadan yalnızca bu tablodan yapılır. Toplam belge, parça, metin
+        boyutu ve kaynak başına belge sayıları aynı işlemde güncellenen
+        sayaçlarda tutulur (bkz. stats).
+        
+        Args:
+            db_path (str): Veritabanı dizini (Chroma verisiyle aynı dizin).
+        """
+        self.db_path = db_path
+        self.db_file = database_file(db_path, "catalog.sqlite3")
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL DEFAULT '',
+                    author TEXT NOT NULL DEFAULT '',
+                    source TEXT NOT NULL DEFAULT '',
+                    file TEXT NOT NULL DEFAULT '',
+                    arxiv_id TEXT,
+                    chunk_count INTEGER NOT NULL,
+                    added_at REAL,
+                    text_bytes INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            # Sayaçlardan önce oluşturulmuş kataloglar
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(documents)")]
+            if "text_bytes" not in columns:
+                conn.execute("ALTER TABLE documents ADD COLUMN text_bytes INTEGER NOT NULL DEFAULT 0")
+            for column in self.SORT_COLUMNS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS documents_{column} ON documents({column}, doc_id)")
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            if conn.execute("SELECT COUNT(*) FROM counters").fetchone()[0] == 0:
+                self._rebuild_counters(conn)
+    
+    @staticmethod
+    def _row(doc_id, metadata, chunk_count, text_bytes, added_at):
+        """
+        Belge metadata'sından tablo satırını oluşturur.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            metadata (dict): Belge metadata'sı
+            chunk_count (int): Parça sayısı
+            text_bytes (int): Parça metinlerinin toplam boyutu (UTF-8 bayt)
+            added_at (float): Eklenme zamanı (Unix zamanı) veya None
+        
+        Returns:
+            tuple: Satır değerleri
+        """
+        return (
+            doc_id,
+            str(metadata.get("title", "")),
+            str(metadata.get("author", "")),
+            str(metadata.get("source", "")),
+            str(metadata.get("file", "")),
+            metadata.get("arxiv_id"),
+            chunk_count,
+            added_at,
+            text_bytes
+        )
+    
+    @staticmethod
+    def _adjust(conn, counts):
+        """
+        Sayaçlara verilen farkları ekler.
+        
+        Args:
+            conn (sqlite3.Connection): Açık bağlantı
+            counts (dict): Sayaç adı -> fark
+        """
+        conn.executemany(
+            """
+            INSERT INTO counters (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+            """,
+            counts.items()
+        )
+    
+    @staticmethod
+    def _counts(row, sign):
+        """
+        Bir belge satırının sayaçlara katkısını döndürür.
+        
+        Args:
+            row (tuple): (parça sayısı, metin boyutu, kaynak)
+            sign (int): Ekleme için 1, silme için -1
+        
+        Returns:
+            dict: Sayaç adı -> fark
+        """
+        chunk_count, text_bytes, source = row
+        return {
+            "documents": sign,
+            "chunks": sign * chunk_count,
+            "text_bytes": sign * text_bytes,
+            f"source:{source}": sign
+        }
+    
+    def _rebuild_counters(self, conn):
+        """
+        Sayaçları belge tablosundan yeniden hesaplar.
+        
+        Args:
+            conn (sqlite3.Connection): Açık bağlantı
+        """
+        conn.execute("DELETE FROM counters")
+        documents, chunks, text_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(chunk_count), 0), COALESCE(SUM(text_bytes), 0) FROM documents"
+        ).fetchone()
+        counts = {"documents": documents, "chunks": chunks, "text_bytes": text_bytes}
+        for source, count in conn.execute("SELECT source, COUNT(*) FROM documents GROUP BY source"):
+            counts[f"source:{source}"] = count
+        self._adjust(conn, counts)
+    
+    def add(self, doc_id, metadata, chunk_count, text_bytes=0):
+        """
+        Belgeyi kataloğa ekler ve sayaçları günceller. Belge zaten kayıtlıysa
+        (ör. yeni arXiv sürümü) bilgileri ve eklenme zamanı güncellenir.
+        
+        Args:
+            doc_id (str): Belge ID'si
+            metadata (dict): Belge metadata'sı; eklenme zamanı "added_at"
+                alanından alınır, yoksa şimdiki zaman kullanılır
+            chunk_count (int): Parça sayısı
+            text_bytes (int): Parça metinlerinin toplam boyutu (UTF-8 bayt)
+        """
+        row = self._row(doc_id, metadata, chunk_count, text_bytes, metadata.get("added_at") or time.time())
+        with connect(self.db_file) as conn:
+            old = conn.execute(
+                "SELECT chunk_count, text_bytes, source FROM documents WHERE doc_id = ?",
+                (doc_id,)
+            ).fetchone()
+            conn.execute(
+                """
+                INSERT INTO documents (doc_id, title, author, source, file, arxiv_id, chunk_count, added_at, text_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(doc_id) DO UPDATE SET
+                    title = excluded.title,
+                    author = excluded.author,
+                    source = excluded.source,
+                    file = excluded.file,
+                    arxiv_id = excluded.arxiv_id,
+                    chunk_count = excluded.chunk_count,
+                    added_at = excluded.added_at,
+                    text_bytes = excluded.text_bytes
+                """,
+                row
+            )
+            if old:
+                self._adjust(conn, self._counts(old, -1))
+            self._adjust(conn, self._counts((chunk_count, text_bytes, row[3]), 1))
+    
+    def remove(self, doc_id):
+        """
+        Belgeyi katalogdan siler ve sayaçları günceller.
+        
+        Args:
+            doc_id (str): Belge ID'si
+        """
+        self.remove_many([doc_id])
+    
+    def remove_many(self, doc_ids):
+        """
+        Belgeleri katalogdan tek işlemde siler ve sayaçları günceller.
+        
+        Args:
+            doc_ids (list): Belge ID'leri
+        """
+        with connect(self.db_file) as conn:
+            for doc_id in doc_ids:
+                old = conn.execute(
+                    "SELECT chunk_count, text_bytes, source FROM documents WHERE doc_id = ?",
+                    (doc_id,)
+                ).fetchone()
+                if old:
+                    conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+                    self._adjust(conn, self._counts(old, -1))
+    
+    def replace_all(self, documents):
+        """
+        Kataloğu verilen belgelerle baştan oluşturur ve sayaçları yeniden
+        hesaplar.
+        
+        Args:
+            documents (iterable): (belge ID'si, metadata, parça sayısı, metin
+                boyutu, eklenme zamanı veya None) beşlileri
+        """
+        with connect(self.db_file) as conn:
+            conn.execute("DELETE FROM documents")
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO documents
+                    (doc_id, title, author, source, file, arxiv_id, chunk_count, added_at, text_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (self._row(*document) for document in documents)
+            )
+            self._rebuild_counters(conn)
+    
+    def stats(self):
+        """
+        Sayaçları okur; belge tablosu taranmaz.
+        
+        Returns:
+            dict: "documents", "chunks", "text_bytes" ve "sources" (kaynak ->
+                belge sayısı) alanları
+        """
+        with connect(self.db_file) as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+        return {
+            "documents": counters.get("documents", 0),
+            "chunks": counters.get("chunks", 0),
+            "text_bytes": counters.get("text_bytes", 0),
+            "sources": {
+                name[len("source:"):]: value
+                for name, value in counters.items()
+                if name.startswith("source:") and value > 0
+            }
+        }
+    
+    def count(self):
+        """
+        Returns:
+            int: Katalogdaki belge sayısı (sayaçtan okunur)
+        """
+        with connect(self.db_file) as conn:
+            row = conn.execute("SELECT value FROM counters WHERE name = 'documents'").fetchone()
+        return row[0] if row else 0
+    
+    def list(self, limit=100, offset=0, order_by="added_at", descending=True):
+        """
+        Belgeleri sıralı ve sayfalı olarak döndürür.
+        
+        Args:
+            limit (int): En fazla belge sayısı
+            offset (int): Atlanacak belge sayısı
+            order_by (str): Sıralama sütunu (bkz. SORT_COLUMNS)
+            descending (bool): Azalan sıralama
+        
+        Returns:
+            list: (belge ID'si, metadata) çiftleri; metadata'da "chunks" ve
+                "added_at" alanları da bulunur
+        """
+        if order_by not in self.SORT_COLUMNS:
+            raise ValueError(f"Geçersiz sıralama alanı: {order_by}")
+        direction = "DESC" if descending else "ASC"
+        
+        with connect(self.db_file) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT doc_id, title, author, source, file, arxiv_id, chunk_count, added_at
+                FROM documents
+                ORDER BY {order_by} {direction}, doc_id {direction}
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset)
+            ).fetchall()
+        
+        documents = []
+        for doc_id, title, author, source, file, arxiv_id, chunk_count, added_at in rows:
+            metadata = {
+                "title": title,
+                "author": author,
+                "source": source,
+                "file": file,
+                "chunks": chunk_count,
+                "added_at": added_at
+            }
+            if arxiv_id:
+                metadata["arxiv_id"] = arxiv_id
+            documents.append((doc_id, metadata))
+        return documents
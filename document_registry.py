@@ -0,0 +1,88 @@
+import time
+from sqlite_store import connect, database_file
+
+class DocumentRegistry:
+    def __init__(self, db_path):
+        """
+        Veritabanına eklenmiş dosyaların yerel dizini.
+        
+        Dosyanın ham baytlarının hash'inden belge ID'sine giden bir tablo
+        tutar. Bir PDF eklenmeden önce bu tabloya bakılır; zaten eklenmiş bir
+        dosya için PDF açılmaz, metin çıkarılmaz ve koleksiyonda metadata
+        taraması yapılmaz.
+        
+        Args:
+            db_path (str): Veritabanı dizini (Chroma verisiyle aynı dizin).
+        """
+        self.db_path = db_path
+        self.db_file = database_file(db_path, "registry.sqlite3")
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    file_hash TEXT PRIMARY KEY,
+                    doc_id TEXT NOT NULL,
+                    added_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS files_doc_id ON files(doc_id)")
+    
+    def find(self, file_hash):
+        """
+        Ham dosya hash'i ile kayıtlı belge ID'sini döndürür.
+        
+        Args:
+            file_hash (str): Dosyanın ham baytlarının hash'i
+        
+        Returns:
+            str: Belge ID'si, kayıt yoksa None
+        """
+        with connect(self.db_file) as conn:
+            row = conn.execute(
+                "SELECT doc_id FROM files WHERE file_hash = ?",
+                (file_hash,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def add(self, file_hash, doc_id):
+        """
+        Dosyayı belge ID'si ile kaydeder.
+        
+        Args:
+            file_hash (str): Dosyanın ham baytlarının hash'i
+            doc_id (str): Belge ID'si
+        """
+        with connect(self.db_file) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO files (file_hash, doc_id, added_at) VALUES (?, ?, ?)",
+                (file_hash, doc_id, time.time())
+            )
+    
+    def remove_file(self, file_hash):
+        """
+        Dosya kaydını siler.
+        
+        Args:
+            file_hash (str): Dosyanın ham baytlarının hash'i
+        """
+        with connect(self.db_file) as conn:
+            conn.execute("DELETE FROM files WHERE file_hash = ?", (file_hash,))
+    
+    def remove_document(self, doc_id):
+        """
+        Belgeye ait tüm dosya kayıtlarını siler.
+        
+        Args:
+            doc_id (str): Belge ID'si
+        """
+        self.remove_documents([doc_id])
+    
+    def remove_documents(self, doc_ids):
+        """
+        Belgelere ait tüm dosya kayıtlarını tek işlemde siler.
+        
+        Args:
+            doc_ids (list): Belge ID'leri
+        """
+        with connect(self.db_file) as conn:
+            conn.executemany("DELETE FROM files WHERE doc_id = ?", [(doc_id,) for doc_id in doc_ids])
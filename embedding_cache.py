@@ -0,0 +1,158 @@
+import time
+import hashlib
+from array import array
+from sqlite_store import connect, database_file, track_size, table_size, evict_lru
+
+class EmbeddingCache:
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024):
+        """
+        Parça metinlerinin embedding vektörleri için disk üzerinde önbellek.
+        
+        Kayıtlar model kimliği ve parça metninin hash'i ile saklanır; aynı
+        metin (silinip yeniden eklenen belge, yeni sürümde değişmeyen
+        bölümler) için embedding yeniden hesaplanmaz. Toplam boyut max_bytes'ı
+        aştığında en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+        
+        Args:
+            cache_dir (str): Önbellek dizini.
+            max_bytes (int): Vektörlerin toplam boyut sınırı.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.db_file = database_file(cache_dir, "embeddings.sqlite3")
+        self.hits = 0
+        self.misses = 0
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings(last_access)")
+            track_size(conn, "embeddings")
+    
+    @staticmethod
+    def _key(model_id, text):
+        """
+        Model kimliği ve metin hash'inden kayıt anahtarını oluşturur.
+        
+        Args:
+            model_id (str): Embedding modelinin kimliği
+            text (str): Parça metni
+        
+        Returns:
+            str: Anahtar
+        """
+        return f"{model_id}:{hashlib.md5(text.encode('utf-8')).hexdigest()}"
+    
+    def embed(self, model_id, texts, embedding_function):
+        """
+        Metinlerin embedding'lerini döndürür. Önbellekte bulunmayanlar tek bir
+        embedding_function çağrısıyla hesaplanıp önbelleğe yazılır.
+        
+        Args:
+            model_id (str): Embedding modelinin kimliği
+            texts (list): Parça metinleri
+            embedding_function (callable): Metin listesinden vektör listesi üretir
+        
+        Returns:
+            list: Her metin için vektör (float listesi), aynı sırada
+        """
+        keys = [self._key(model_id, text) for text in texts]
+        vectors = self._get_many(keys)
+        
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        
+        if missing:
+            computed = embedding_function([texts[i] for i in missing])
+            for i, vector in zip(missing, computed):
+                # Önbellekten okunanlarla aynı (float32) hassasiyette döndür
+                vectors[i] = array("f", vector).tolist()
+            self._put_many([(keys[i], vectors[i]) for i in missing])
+        
+        return vectors
+    
+    def _get_many(self, keys):
+        """
+        Anahtarların vektörlerini okur ve son erişim zamanlarını günceller.
+        
+        Args:
+            keys (list): Kayıt anahtarları
+        
+        Returns:
+            list: Vektörler, bulunmayanlar için None
+        """
+        found = {}
+        try:
+            with connect(self.db_file) as conn:
+                # SQLite değişken sınırını aşmamak için gruplar halinde sorgula
+                for start in range(0, len(keys), 500):
+                    group = keys[start:start + 500]
+                    placeholders = ", ".join("?" * len(group))
+                    for key, vector in conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        group
+                    ):
+                        found[key] = array("f", vector).tolist()
+                
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+        except Exception as e:
+            print(f"Embedding önbelleği okuma hatası: {e}")
+        
+        return [found.get(key) for key in keys]
+    
+    def _put_many(self, items):
+        """
+        Vektörleri önbelleğe yazar ve gerekirse eski kayıtları siler.
+        
+        Args:
+            items (list): (anahtar, vektör) çiftleri
+        """
+        try:
+            now = time.time()
+            rows = []
+            for key, vector in items:
+                data = array("f", vector).tobytes()
+                rows.append((key, data, len(data), now))
+            
+            with connect(self.db_file) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO embeddings (key, vector, size, last_access) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        vector = excluded.vector,
+                        size = excluded.size,
+                        last_access = excluded.last_access
+                    """,
+                    rows
+                )
+                evict_lru(conn, "embeddings", "key", self.max_bytes)
+        except Exception as e:
+            print(f"Embedding önbelleği yazma hatası: {e}")
+    
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür. Kayıt sayısı ve boyut
+        tetikleyicilerle güncellenen toplamlardan okunur, tablo taranmaz.
+        
+        Returns:
+            dict: hits, misses, entries ve size (bayt) alanları
+        """
+        with connect(self.db_file) as conn:
+            entries, size = table_size(conn, "embeddings")
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size": size
+        }
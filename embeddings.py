@@ -0,0 +1,141 @@
+import os
+import re
+import hashlib
+from array import array
+from chromadb.api.types import EmbeddingFunction
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+from chunking import WordTokenCounter, TokenizerTokenCounter
+
+class OnnxMiniLMEmbedding(ONNXMiniLM_L6_V2):
+    model_id = "all-MiniLM-L6-v2"
+    max_tokens = 254  # 256 token penceresi, [CLS] ve [SEP] hariç
+    
+    def __init__(self, batch_size=32, threads=None, preferred_providers=None):
+        """
+        Chroma'nın varsayılan modeli (all-MiniLM-L6-v2, ONNX) için yığın
+        boyutu ve iş parçacığı sayısı ayarlanabilen embedding fonksiyonu.
+        
+        Args:
+            batch_size (int): Modelin tek seferde işlediği metin sayısı
+            threads (int, optional): ONNX Runtime iç işlem (intra-op) iş
+                parçacığı sayısı, None ise ONNX Runtime varsayılanı
+            preferred_providers (list, optional): ONNX Runtime sağlayıcıları
+        """
+        super().__init__(preferred_providers=preferred_providers)
+        self.batch_size = batch_size
+        self.threads = threads
+    
+    def _init_model_and_tokenizer(self):
+        """
+        Tokenizer'ı ve ONNX oturumunu ilk kullanımda, iş parçacığı ayarıyla
+        oluşturur.
+        """
+        if self.model is not None and self.tokenizer is not None:
+            return
+        
+        model_dir = os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME)
+        self.tokenizer = self.Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=256)
+        self.tokenizer.enable_padding(pad_id=0, pad_token="[PAD]", length=256)
+        
+        options = self.ort.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+        
+        self.model = self.ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            sess_options=options,
+            providers=self._preferred_providers or self.ort.get_available_providers()
+        )
+    
+    def token_counter(self):
+        """
+        Modelin tokenizer'ıyla token sayan sayacı döndürür (gerekirse modeli indirir).
+        
+        Returns:
+            TokenizerTokenCounter: Sayaç
+        """
+        self._download_model_if_not_exists()
+        return TokenizerTokenCounter(
+            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "tokenizer.json")
+        )
+    
+    def __call__(self, input):
+        """
+        Metinlerin embedding'lerini batch_size'lık yığınlar halinde hesaplar.
+        
+        Args:
+            input (list): Metinler
+        
+        Returns:
+            list: Her metin için vektör
+        """
+        self._download_model_if_not_exists()
+        self._init_model_and_tokenizer()
+        return self._forward(input, batch_size=self.batch_size).tolist()
+
+
+class HashingEmbedding(EmbeddingFunction):
+    max_tokens = 256  # Varsayılan modelle aynı parça boyutu
+    
+    def __init__(self, dimensions=384):
+        """
+        Model gerektirmeyen, deterministik embedding fonksiyonu.
+        
+        Kelimeler hash'lenerek sabit boyutlu bir vektöre işaretli olarak
+        eklenir ve vektör normalize edilir (feature hashing). Anlamsal
+        benzerlik yakalamaz; ağ erişimi olmayan testler ve ölçümler içindir.
+        
+        Args:
+            dimensions (int): Vektör boyutu
+        """
+        self.dimensions = dimensions
+        self.model_id = f"hashing-{dimensions}"
+    
+    def token_counter(self):
+        """
+        Returns:
+            WordTokenCounter: Kelime ve noktalama sayan sayaç
+        """
+        return WordTokenCounter()
+    
+    def __call__(self, input):
+        """
+        Metinlerin embedding'lerini hesaplar.
+        
+        Args:
+            input (list): Metinler
+        
+        Returns:
+            list: Her metin için vektör
+        """
+        embeddings = []
+        for text in input:
+            vector = array("f", bytes(4 * self.dimensions))
+            for word in re.findall(r"\w+", text.lower()):
+                digest = hashlib.md5(word.encode("utf-8")).digest()
+                index = int.from_bytes(digest[:4], "little") % self.dimensions
+                vector[index] += 1.0 if digest[4] & 1 else -1.0
+            
+            norm = sum(value * value for value in vector) ** 0.5 or 1.0
+            embeddings.append([value / norm for value in vector])
+        return embeddings
+
+
+def create_embedding_function(backend="onnx", batch_size=32, threads=None):
+    """
+    Ayarlara göre embedding fonksiyonunu oluşturur.
+    
+    Args:
+        backend (str): "onnx" (all-MiniLM-L6-v2) veya "hashing" (çevrimdışı)
+        batch_size (int): Modelin tek seferde işlediği metin sayısı
+        threads (int, optional): ONNX Runtime iş parçacığı sayısı
+    
+    Returns:
+        EmbeddingFunction: model_id özelliği olan embedding fonksiyonu
+    """
+    if backend == "hashing":
+        return HashingEmbedding()
+    if backend == "onnx":
+        return OnnxMiniLMEmbedding(batch_size=batch_size, threads=threads)
+    raise ValueError(f"Bilinmeyen embedding altyapısı: {backend}")
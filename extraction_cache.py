@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+from sqlite_store import connect, database_file, track_size, evict_lru
+
+class ExtractionCache:
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        """
+        PDF'lerden çıkarılan metin ve metadata için disk üzerinde önbellek.
+        
+        Kayıtlar dosyanın ham baytlarının hash'i ile saklanır (içerik adresli),
+        böylece bellekteki PDF içerikleri de aynı önbelleği kullanabilir.
+        Dosya yolu, boyut ve değişiklik zamanından hash'e giden ayrı bir tablo
+        tutulur; değişmemiş bir dosya için önbelleğe erişmek yalnızca
+        bir stat çağrısına mal olur. Toplam boyut max_bytes'ı aştığında en uzun
+        süredir kullanılmayan kayıtlar silinir (LRU).
+        
+        Args:
+            cache_dir (str): Önbellek dizini.
+            max_bytes (int): Sıkıştırılmış kayıtların toplam boyut sınırı.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.db_file = database_file(cache_dir, "extractions.sqlite3")
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    content_hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+            track_size(conn, "entries")
+    
+    @staticmethod
+    def hash_file(path):
+        """
+        Dosyanın ham baytlarının MD5 değerini parça parça okuyarak hesaplar.
+        
+        Args:
+            path (str): Dosya yolu
+        
+        Returns:
+            str: Hex hash
+        """
+        file_hash = hashlib.md5()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+    
+    def file_key(self, path):
+        """
+        Dosyanın içerik hash'ini döndürür. Boyut ve değişiklik zamanı kayıtlı
+        değerlerle aynıysa dosya okunmaz.
+        
+        Args:
+            path (str): Dosya yolu
+        
+        Returns:
+            str: Hex hash
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        
+        with connect(self.db_file) as conn:
+            row = conn.execute(
+                "SELECT content_hash FROM files WHERE path = ? AND file_size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row[0]
+        
+        content_hash = self.hash_file(path)
+        with connect(self.db_file) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, file_size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, content_hash)
+            )
+        return content_hash
+    
+    @staticmethod
+    def _entry_key(content_hash, kind):
+        """
+        Kayıt anahtarını oluşturur; tam çıkarım sonucu doğrudan içerik hash'i
+        ile, diğer türler (ör. "metadata") hash'e eklenen son ekle saklanır.
+        
+        Args:
+            content_hash (str): Ham baytların hash'i
+            kind (str, optional): Kayıt türü
+        
+        Returns:
+            str: Anahtar
+        """
+        return content_hash if kind is None else f"{content_hash}:{kind}"
+    
+    def get(self, content_hash, kind=None):
+        """
+        İçerik hash'i için önbellekteki çıkarım sonucunu döndürür.
+        
+        Args:
+            content_hash (str): Ham baytların hash'i (bkz. file_key)
+            kind (str, optional): Kayıt türü, None ise tam çıkarım sonucu
+        
+        Returns:
+            dict: Kayıtlı sonuç, yoksa None
+        """
+        key = self._entry_key(content_hash, kind)
+        try:
+            with connect(self.db_file) as conn:
+                row = conn.execute(
+                    "SELECT data FROM entries WHERE content_hash = ?",
+                    (key,)
+                ).fetchone()
+                if not row:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE content_hash = ?",
+                    (time.time(), key)
+                )
+            return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        except Exception as e:
+            print(f"Önbellek okuma hatası ({key}): {e}")
+            return None
+    
+    def put(self, content_hash, value, kind=None):
+        """
+        Çıkarım sonucunu önbelleğe yazar ve gerekirse eski kayıtları siler.
+        
+        Args:
+            content_hash (str): Ham baytların hash'i (bkz. file_key)
+            value (dict): JSON'a çevrilebilir sonuç
+            kind (str, optional): Kayıt türü, None ise tam çıkarım sonucu
+        """
+        key = self._entry_key(content_hash, kind)
+        try:
+            data = zlib.compress(json.dumps(value).encode("utf-8"))
+            if len(data) > self.max_bytes:
+                return
+            
+            with connect(self.db_file) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO entries (content_hash, data, size, last_access) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(content_hash) DO UPDATE SET
+                        data = excluded.data,
+                        size = excluded.size,
+                        last_access = excluded.last_access
+                    """,
+                    (key, data, len(data), time.time())
+                )
+                evicted = evict_lru(conn, "entries", "content_hash", self.max_bytes)
+                conn.executemany("DELETE FROM files WHERE content_hash = ?", [(content_hash,) for content_hash in evicted])
+        except Exception as e:
+            print(f"Önbellek yazma hatası ({key}): {e}")
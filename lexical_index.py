@@ -0,0 +1,205 @@
+import re
+import math
+from collections import Counter
+from sqlite_store import connect, database_file
+
+def tokenize(text):
+    """
+    Metni arama terimlerine böler. Nokta veya tire içeren tanımlayıcılar
+    ("2401.01234", "gpt-4", "bert-base") hem bütün olarak hem de parçalarıyla
+    terim sayılır; böylece tam tanımlayıcı ve parçaları ayrı ayrı aranabilir.
+    
+    Args:
+        text (str): Metin
+    
+    Returns:
+        list: Küçük harfe çevrilmiş terimler
+    """
+    terms = []
+    for token in re.findall(r"\w(?:[\w.\-]*\w)?", text.lower()):
+        terms.append(token)
+        if "." in token or "-" in token:
+            terms.extend(re.findall(r"\w+", token))
+    return terms
+
+
+class LexicalIndex:
+    def __init__(self, db_path, k1=1.2, b=0.75):
+        """
+        Parça metinleri için kalıcı ters dizin (BM25).
+        
+        Her terim için geçtiği parçalar ve terim sıklığı SQLite'ta tutulur.
+        Sorgu vektöre çevrilmeden yalnızca sorgu terimlerinin listeleri
+        okunur; arXiv ID'leri, model adları ve denklem etiketleri gibi tam
+        terimler vektör aramasından daha güvenilir ve çok daha hızlı bulunur.
+        
+        Args:
+            db_path (str): Veritabanı dizini (Chroma verisiyle aynı dizin).
+            k1 (float): BM25 terim sıklığı doygunluk katsayısı
+            b (float): BM25 parça uzunluğu normalizasyon katsayısı
+        """
+        self.db_path = db_path
+        self.k1 = k1
+        self.b = b
+        self.db_file = database_file(db_path, "lexical.sqlite3")
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    chunk_id TEXT PRIMARY KEY,
+                    doc_id TEXT NOT NULL,
+                    length INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS chunks_doc_id ON chunks(doc_id)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    chunk_id TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, chunk_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS postings_chunk_id ON postings(chunk_id)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS totals (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO totals VALUES ('chunks', 0), ('length', 0)")
+    
+    @staticmethod
+    def _delete(conn, chunk_ids):
+        """
+        Parçaları dizinden siler ve toplamları günceller.
+        
+        Args:
+            conn (sqlite3.Connection): Açık bağlantı
+            chunk_ids (list): Parça ID'leri
+        """
+        for chunk_id in chunk_ids:
+            row = conn.execute("SELECT length FROM chunks WHERE chunk_id = ?", (chunk_id,)).fetchone()
+            if row is None:
+                continue
+            conn.execute("DELETE FROM postings WHERE chunk_id = ?", (chunk_id,))
+            conn.execute("DELETE FROM chunks WHERE chunk_id = ?", (chunk_id,))
+            conn.execute("UPDATE totals SET value = value - 1 WHERE name = 'chunks'")
+            conn.execute("UPDATE totals SET value = value - ? WHERE name = 'length'", (row[0],))
+    
+    def add(self, chunk_ids, doc_ids, texts):
+        """
+        Parçaları dizine ekler; aynı ID ile kayıtlı parçaların yerine geçer.
+        
+        Args:
+            chunk_ids (list): Parça ID'leri
+            doc_ids (list): Her parçanın belge ID'si
+            texts (list): Parça metinleri
+        """
+        with connect(self.db_file) as conn:
+            self._delete(conn, chunk_ids)
+            for chunk_id, doc_id, text in zip(chunk_ids, doc_ids, texts):
+                terms = tokenize(text or "")
+                conn.execute(
+                    "INSERT INTO chunks (chunk_id, doc_id, length) VALUES (?, ?, ?)",
+                    (chunk_id, doc_id, len(terms))
+                )
+                conn.executemany(
+                    "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                    [(term, chunk_id, tf) for term, tf in Counter(terms).items()]
+                )
+                conn.execute("UPDATE totals SET value = value + 1 WHERE name = 'chunks'")
+                conn.execute("UPDATE totals SET value = value + ? WHERE name = 'length'", (len(terms),))
+    
+    def remove(self, chunk_ids):
+        """
+        Parçaları dizinden siler.
+        
+        Args:
+            chunk_ids (list): Parça ID'leri
+        """
+        with connect(self.db_file) as conn:
+            self._delete(conn, chunk_ids)
+    
+    def remove_documents(self, doc_ids):
+        """
+        Belgelerin tüm parçalarını dizinden siler.
+        
+        Args:
+            doc_ids (list): Belge ID'leri
+        """
+        with connect(self.db_file) as conn:
+            chunk_ids = []
+            for doc_id in doc_ids:
+                chunk_ids.extend(
+                    row[0] for row in conn.execute("SELECT chunk_id FROM chunks WHERE doc_id = ?", (doc_id,))
+                )
+            self._delete(conn, chunk_ids)
+    
+    def clear(self):
+        """
+        Dizini boşaltır.
+        """
+        with connect(self.db_file) as conn:
+            conn.execute("DELETE FROM postings")
+            conn.execute("DELETE FROM chunks")
+            conn.execute("UPDATE totals SET value = 0")
+    
+    def count(self):
+        """
+        Returns:
+            int: Dizindeki parça sayısı
+        """
+        with connect(self.db_file) as conn:
+            return conn.execute("SELECT value FROM totals WHERE name = 'chunks'").fetchone()[0]
+    
+    def search(self, query, n_results=10):
+        """
+        Sorgu terimlerini BM25 ile puanlar.
+        
+        Args:
+            query (str): Arama sorgusu
+            n_results (int): En fazla sonuç sayısı
+        
+        Returns:
+            list: Puana göre azalan (parça ID'si, puan) çiftleri
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        
+        with connect(self.db_file) as conn:
+            totals = dict(conn.execute("SELECT name, value FROM totals"))
+            chunk_count = totals.get("chunks", 0)
+            if chunk_count == 0:
+                return []
+            average_length = max(totals.get("length", 0) / chunk_count, 1)
+            
+            # Terimlerin ters belge sıklığı (idf)
+            placeholders = ", ".join("?" * len(terms))
+            weights = []
+            for term, df in conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term",
+                terms
+            ):
+                weights.append((term, math.log(1 + (chunk_count - df + 0.5) / (df + 0.5))))
+            if not weights:
+                return []
+            
+            values = ", ".join("(?, ?)" for _ in weights)
+            rows = conn.execute(
+                f"""
+                WITH query(term, idf) AS (VALUES {values})
+                SELECT p.chunk_id,
+                       SUM(q.idf * p.tf * (? + 1) / (p.tf + ? * (1 - ? + ? * c.length / ?))) AS score
+                FROM query q
+                JOIN postings p ON p.term = q.term
+                JOIN chunks c ON c.chunk_id = p.chunk_id
+                GROUP BY p.chunk_id
+                ORDER BY score DESC
+                LIMIT ?
+                """,
+                [value for weight in weights for value in weight]
+                + [self.k1, self.k1, self.b, self.b, average_length, n_results]
+            ).fetchall()
+        return rows
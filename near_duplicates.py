@@ -0,0 +1,212 @@
+import re
+import hashlib
+from array import array
+from sqlite_store import connect, database_file
+
+def _hash64(value):
+    """
+    Metnin 64 bitlik hash'i.
+    
+    Args:
+        value (str): Metin
+    
+    Returns:
+        int: Hash
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash_signature(text, num_perm=128, shingle_size=5):
+    """
+    Metnin kelime shingle'ları üzerinden MinHash imzasını hesaplar.
+    
+    Tek permütasyonlu hashing kullanılır: her shingle bir kez hash'lenir ve
+    hash'in kalanına göre bir kutuya düşer; her kutuda en küçük değer tutulur.
+    Boş kalan kutular sonraki dolu kutudan doldurulur (densification). Metin
+    küçük harfe çevrilip kelimelere ayrıldığı için boşluk ve satır sonu
+    farkları imzayı etkilemez.
+    
+    Args:
+        text (str): Metin
+        num_perm (int): İmza uzunluğu
+        shingle_size (int): Shingle başına kelime sayısı
+    
+    Returns:
+        list: num_perm uzunluğunda imza; metin boşsa None
+    """
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return None
+    
+    bins = [None] * num_perm
+    for i in range(max(len(words) - shingle_size + 1, 1)):
+        value = _hash64(" ".join(words[i:i + shingle_size]))
+        index = value % num_perm
+        value //= num_perm
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    
+    # Boş kutuları döngüsel olarak sonraki dolu kutunun değeriyle doldur
+    signature = list(bins)
+    for index in range(num_perm):
+        distance = 1
+        while signature[index] is None:
+            donor = bins[(index + distance) % num_perm]
+            if donor is not None:
+                signature[index] = (donor + distance * 0x9E3779B97F4A7C15) % (1 << 63)
+            distance += 1
+    return signature
+
+
+def estimate_similarity(first, second):
+    """
+    İki MinHash imzasından Jaccard benzerliğini tahmin eder.
+    
+    Args:
+        first (list): İmza
+        second (list): İmza
+    
+    Returns:
+        float: 0 ile 1 arasında benzerlik
+    """
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class NearDuplicateIndex:
+    def __init__(self, db_path, num_perm=128, bands=16):
+        """
+        Belgelerin MinHash imzaları için kalıcı LSH dizini.
+        
+        İmzalar bands gruba bölünür ve her grup bir kovaya hash'lenir; en az
+        bir kovayı paylaşan belgeler aday sayılır ve yalnızca adayların
+        imzaları karşılaştırılır. Böylece sorgu maliyeti belge sayısıyla
+        doğrusal artmaz.
+        
+        Args:
+            db_path (str): Veritabanı dizini (Chroma verisiyle aynı dizin).
+            num_perm (int): İmza uzunluğu
+            bands (int): LSH grup sayısı (num_perm'i tam bölmeli)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm, bands değerine tam bölünmeli.")
+        self.db_path = db_path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.db_file = database_file(db_path, "near_duplicates.sqlite3")
+        
+        with connect(self.db_file) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS signatures (
+                    doc_id TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    bucket TEXT NOT NULL,
+                    doc_id TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS buckets_bucket ON buckets(bucket)")
+            conn.execute("CREATE INDEX IF NOT EXISTS buckets_doc_id ON buckets(doc_id)")
+    
+    def signature(self, text):
+        """
+        Metnin bu dizinin ayarlarıyla MinHash imzasını hesaplar.
+        
+        Args:
+            text (str): Metin
+        
+        Returns:
+            list: İmza; metin boşsa None
+        """
+        return minhash_signature(text, num_perm=self.num_perm)
+    
+    def _buckets(self, signature):
+        """
+        İmzanın LSH kova anahtarlarını üretir.
+        
+        Args:
+            signature (list): İmza
+        
+        Returns:
+            list: Kova anahtarları
+        """
+        buckets = []
+        for band in range(self.bands):
+            rows = array("Q", signature[band * self.rows:(band + 1) * self.rows]).tobytes()
+            buckets.append(f"{band}:{hashlib.blake2b(rows, digest_size=8).hexdigest()}")
+        return buckets
+    
+    def find(self, signature, threshold, exclude_doc_id=None):
+        """
+        İmzaya en benzer kayıtlı belgeyi bulur.
+        
+        Args:
+            signature (list): Sorgu imzası
+            threshold (float): En düşük tahmini Jaccard benzerliği
+            exclude_doc_id (str, optional): Yok sayılacak belge (ör. güncellenen belge)
+        
+        Returns:
+            tuple: (belge ID'si, benzerlik); eşiği geçen yoksa None
+        """
+        buckets = self._buckets(signature)
+        placeholders = ", ".join("?" * len(buckets))
+        with connect(self.db_file) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT s.doc_id, s.signature FROM signatures s
+                WHERE s.doc_id IN (SELECT DISTINCT doc_id FROM buckets WHERE bucket IN ({placeholders}))
+                """,
+                buckets
+            ).fetchall()
+        
+        best = None
+        for doc_id, stored in rows:
+            if doc_id == exclude_doc_id:
+                continue
+            similarity = estimate_similarity(signature, array("Q", stored).tolist())
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (doc_id, similarity)
+        return best
+    
+    def add(self, doc_id, signature):
+        """
+        Belgenin imzasını kaydeder (varsa eskisinin yerine).
+        
+        Args:
+            doc_id (str): Belge ID'si
+            signature (list): İmza
+        """
+        with connect(self.db_file) as conn:
+            conn.execute("DELETE FROM buckets WHERE doc_id = ?", (doc_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO signatures (doc_id, signature) VALUES (?, ?)",
+                (doc_id, array("Q", signature).tobytes())
+            )
+            conn.executemany(
+                "INSERT INTO buckets (bucket, doc_id) VALUES (?, ?)",
+                [(bucket, doc_id) for bucket in self._buckets(signature)]
+            )
+    
+    def remove(self, doc_id):
+        """
+        Belgenin imzasını siler.
+        
+        Args:
+            doc_id (str): Belge ID'si
+        """
+        self.remove_many([doc_id])
+    
+    def remove_many(self, doc_ids):
+        """
+        Belgelerin imzalarını tek işlemde siler.
+        
+        Args:
+            doc_ids (list): Belge ID'leri
+        """
+        rows = [(doc_id,) for doc_id in doc_ids]
+        with connect(self.db_file) as conn:
+            conn.executemany("DELETE FROM buckets WHERE doc_id = ?", rows)
+            conn.executemany("DELETE FROM signatures WHERE doc_id = ?", rows)
@@ -1,56 +1,782 @@
+import io
 import os
 import re
+import hashlib
+import time
+import multiprocessing
+from contextlib import contextmanager
 import PyPDF2
 from datetime import datetime
+from extraction_cache import ExtractionCache
+
+class _BufferReader:
+    def __init__(self, view):
+        """
+        Bellekteki bir tamponu kopyalamadan PyPDF2'ye dosya gibi sunan salt
+        okunur akış. Yalnızca istenen dilimler kopyalanır.
+        
+        Args:
+            view (memoryview): Bayt tamponu.
+        """
+        self.view = view
+        self.position = 0
+    
+    def read(self, size=-1):
+        end = len(self.view) if size is None or size < 0 else min(self.position + size, len(self.view))
+        data = self.view[self.position:end].tobytes()
+        self.position = max(self.position, end)
+        return data
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+    
+    def tell(self):
+        return self.position
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+
+
+class PageCleaner:
+    # Sonrası (ekler dahil) atlanan bölüm başlıkları
+    REFERENCES_HEADING = re.compile(r"^(?:\d+\.?|[IVX]+\.)?\s*(references|bibliography)$", re.IGNORECASE)
+    # Yalnızca kendisi atlanan bölüm başlıkları
+    SKIPPED_HEADING = re.compile(r"^(?:\d+\.?|[IVX]+\.)?\s*(acknowledge?ments?)$", re.IGNORECASE)
+    # Atlanan bölümün bittiğini gösteren başlık ("5 Conclusion", "A Proofs")
+    SECTION_HEADING = re.compile(r"^(?:\d+(?:\.\d+)*\.?|[A-Z]\.?|[IVX]+\.)\s+[A-Z][^.]{0,80}$")
+    
+    def __init__(self, sample_pages=8, edge_lines=2, min_body_chars=2000, count_tokens=None):
+        """
+        Sayfa metinlerini parçalamadan önce temizleyen ön işlem.
+        
+        - Satır sonunda bölünmüş kelimeleri birleştirir ("embed-\\nding").
+        - Sayfaların başında ve sonunda tekrar eden üst/alt bilgileri
+          (dergi adı, yazar adları, sayfa numaraları) siler.
+        - Kaynakça ve sonrasını (ekler) ve teşekkür bölümünü atlar.
+        
+        Akış halinde çalışır; üst/alt bilgileri öğrenmek için yalnızca ilk
+        sample_pages sayfa bellekte tutulur. İstatistikler self.stats alanındadır.
+        
+        Args:
+            sample_pages (int): Üst/alt bilgi tespiti için incelenen sayfa sayısı
+            edge_lines (int): Sayfa başında ve sonunda incelenen satır sayısı
+            min_body_chars (int): Kaynakça başlığının dikkate alınması için
+                önce gelmesi gereken metin miktarı (içindekiler tablosunu ayırmak için)
+            count_tokens (callable, optional): Verilirse atılan metnin token
+                sayısı stats["tokens_removed"] alanında toplanır
+        """
+        self.sample_pages = sample_pages
+        self.edge_lines = edge_lines
+        self.min_body_chars = min_body_chars
+        self.count_tokens = count_tokens
+        self.stats = {
+            "chars_in": 0,
+            "chars_out": 0,
+            "tokens_removed": 0,
+            "dehyphenated": 0,
+            "header_footer_lines": 0,
+            "skipped_sections": []
+        }
+    
+    def _removed(self, text):
+        """
+        Atılan metnin token sayısını istatistiğe ekler.
+        
+        Args:
+            text (str): Atılan metin
+        """
+        if self.count_tokens is not None and text.strip():
+            self.stats["tokens_removed"] += self.count_tokens(text)
+    
+    @staticmethod
+    def _edge_key(line):
+        """
+        Üst/alt bilgi satırlarını sayfa numarasından bağımsız karşılaştırmak
+        için rakamları maskeler.
+        
+        Args:
+            line (str): Satır
+        
+        Returns:
+            str: Anahtar
+        """
+        return re.sub(r"\d+", "#", line.strip().lower())
+    
+    def _edges(self, lines):
+        """
+        Sayfanın başındaki ve sonundaki boş olmayan satırların indekslerini döndürür.
+        
+        Args:
+            lines (list): Sayfa satırları
+        
+        Returns:
+            list: Satır indeksleri
+        """
+        filled = [i for i, line in enumerate(lines) if line.strip()]
+        return sorted(set(filled[:self.edge_lines] + filled[-self.edge_lines:]))
+    
+    def _learn_edges(self, sample):
+        """
+        Örnek sayfaların yarısından fazlasında tekrar eden kenar satırlarını bulur.
+        
+        Args:
+            sample (list): Satırlara bölünmüş örnek sayfalar
+        
+        Returns:
+            set: Üst/alt bilgi anahtarları
+        """
+        if len(sample) < 3:
+            return set()
+        
+        counts = {}
+        for lines in sample:
+            for key in {self._edge_key(lines[i]) for i in self._edges(lines)}:
+                counts[key] = counts.get(key, 0) + 1
+        return {key for key, count in counts.items() if count > len(sample) / 2}
+    
+    def clean(self, pages):
+        """
+        Sayfa metinlerini temizleyerek üretir. Tamamen atlanan sayfalar
+        üretilmez, ancak kaynak sayfalar sonuna kadar okunur.
+        
+        Args:
+            pages (iterable): Sayfa metinleri
+        
+        Yields:
+            str: Temizlenmiş sayfa metni (sonunda satır sonu ile)
+        """
+        stats = self.stats
+        sample = []
+        edge_keys = None
+        state = {"skip": None, "body_chars": 0}
+        
+        for page_text in pages:
+            stats["chars_in"] += len(page_text)
+            if state["skip"] == "rest":
+                self._removed(page_text)
+                continue
+            
+            page_text, joined = re.subn(r"(\w)-\n(?=[a-z])", r"\1", page_text)
+            stats["dehyphenated"] += joined
+            
+            if edge_keys is None:
+                sample.append(page_text.split("\n"))
+                if len(sample) < self.sample_pages:
+                    continue
+                edge_keys = self._learn_edges(sample)
+                for lines in sample:
+                    yield from self._clean_page(lines, edge_keys, state)
+                sample = []
+            else:
+                yield from self._clean_page(page_text.split("\n"), edge_keys, state)
+        
+        # Örnek dolmadan biten kısa belgeler
+        if edge_keys is None:
+            edge_keys = self._learn_edges(sample)
+            for lines in sample:
+                yield from self._clean_page(lines, edge_keys, state)
+    
+    def _clean_page(self, lines, edge_keys, state):
+        """
+        Tek bir sayfadan üst/alt bilgileri ve atlanan bölümleri çıkarır.
+        
+        Args:
+            lines (list): Sayfa satırları
+            edge_keys (set): Üst/alt bilgi anahtarları
+            state (dict): Sayfalar arasında taşınan bölüm durumu
+        
+        Yields:
+            str: Temizlenmiş sayfa metni; boş kalan sayfalar üretilmez
+        """
+        stats = self.stats
+        if state["skip"] == "rest":
+            return
+        
+        edges = set(self._edges(lines)) if edge_keys else set()
+        kept = []
+        for i, line in enumerate(lines):
+            if i in edges and self._edge_key(line) in edge_keys:
+                stats["header_footer_lines"] += 1
+                self._removed(line)
+                continue
+            
+            heading = line.strip()
+            match = self.REFERENCES_HEADING.match(heading)
+            if match and state["body_chars"] >= self.min_body_chars:
+                stats["skipped_sections"].append(match.group(1).lower())
+                state["skip"] = "rest"
+                self._removed("\n".join(lines[i:]))
+                break
+            
+            match = self.SKIPPED_HEADING.match(heading)
+            if match:
+                stats["skipped_sections"].append(match.group(1).lower())
+                state["skip"] = "section"
+                continue
+            
+            if state["skip"] == "section":
+                if not self.SECTION_HEADING.match(heading):
+                    self._removed(line)
+                    continue
+                state["skip"] = None
+            
+            kept.append(line)
+            state["body_chars"] += len(line)
+        
+        text = "\n".join(kept).strip("\n")
+        if text:
+            stats["chars_out"] += len(text) + 1
+            yield text + "\n"
+
 
 class PDFProcessor:
-    def __init__(self, pdf_path):
+    # Tüm işleyicilerin varsayılan olarak kullandığı çıkarım önbelleği (ExtractionCache)
+    cache = None
+    # Bu boyuttan uzun metinler önbelleğe alınmaz (akış halinde bellek sınırlı kalsın)
+    cache_max_chars = 10 * 1024 * 1024
+    # Belge başına varsayılan sınırlar (None: sınırsız)
+    max_pages = None
+    timeout = None
+    # Hızlı metadata okuması süresi aşılan dosyalar bu kadar saniye yeniden denenmez
+    metadata_retry_after = 300
+    _metadata_timeouts = {}  # Dosya anahtarı -> yeniden denenebileceği zaman
+    
+    def __init__(self, source, parsed=None, cache=None, name=None, max_pages=None, timeout=None):
         """
         PDF dosyasını işlemek için bir sınıf.
         
         Args:
-            pdf_path (str): PDF dosyasının yolu.
+            source: PDF dosyasının yolu (str) ya da içeriği; bytes, bytearray,
+                memoryview, mmap veya okunabilir dosya benzeri nesne. Tampon
+                kaynaklar kopyalanmadan okunur ve hash'lenir.
+            parsed (dict, optional): Daha önce parse() ile elde edilmiş sonuç.
+            cache (ExtractionCache, optional): Çıkarım önbelleği; verilmezse
+                PDFProcessor.cache kullanılır.
+            name (str, optional): Bellekteki kaynaklar için dosya adı (başlık
+                ve arXiv ID tahmininde kullanılır).
+            max_pages (int, optional): Okunacak en fazla sayfa sayısı; verilmezse
+                PDFProcessor.max_pages kullanılır.
+            timeout (float, optional): Metin çıkarma için saniye cinsinden süre
+                sınırı; verilmezse PDFProcessor.timeout kullanılır. Tanımlıysa
+                dosya kaynakları süre dolunca sonlandırılabilen ayrı bir
+                süreçte okunur. Bellekteki kaynaklar ayrı sürece kopyalanmamak
+                için bu süreçte okunur; süre yalnızca sayfalar arasında
+                denetlenir, tek bir sayfada takılan okuma kesilemez.
         """
-        self.pdf_path = pdf_path
+        self.source = source
+        if isinstance(source, (str, os.PathLike)):
+            self.pdf_path = os.fspath(source)
+        else:
+            self.pdf_path = name or getattr(source, "name", None) or "document.pdf"
+        self._parsed = parsed
+        self._file_hash = None
+        self.cache = cache if cache is not None else PDFProcessor.cache
+        self.max_pages = max_pages if max_pages is not None else PDFProcessor.max_pages
+        self.timeout = timeout if timeout is not None else PDFProcessor.timeout
+        self.info = None
+        self.page_count = 0
+        self.total_pages = None
+        self.error = None
+        # "complete", "page_limit" (sayfa sınırı), "timeout" (süre sınırı) veya "failed"
+        self.status = None
+        # iter_clean_pages sonrası temizleme istatistikleri (bkz. PageCleaner)
+        self.cleanup_stats = None
     
-    def extract_text(self):
+    def _buffer(self):
         """
-        PDF dosyasından metin çıkarır.
+        Kaynak bir bayt tamponuysa (bytes, memoryview, mmap...) ona kopyasız
+        bir görünüm döndürür.
         
         Returns:
-            str: Çıkarılan metin, başarısızsa boş string.
+            memoryview: Tampon görünümü, kaynak dosya yolu veya akışsa None
         """
+        if isinstance(self.source, (str, os.PathLike)):
+            return None
         try:
-            text = ""
-            with open(self.pdf_path, 'rb') as file:
+            return memoryview(self.source).cast("B")
+        except TypeError:
+            return None
+    
+    @contextmanager
+    def _open_stream(self):
+        """
+        Kaynağı PyPDF2'nin okuyabileceği bir akış olarak açar.
+        
+        Yields:
+            Okunabilir ve konumlanabilir akış.
+        """
+        if isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, 'rb') as file:
+                yield file
+            return
+        
+        view = self._buffer()
+        if view is not None:
+            yield _BufferReader(view)
+        else:
+            self.source.seek(0)
+            yield self.source
+    
+    def file_hash(self):
+        """
+        PDF'in ham baytlarının hash'ini döndürür. Tampon kaynaklar kopyalanmadan
+        hash'lenir; dosyalar için önbellek varsa değişmemiş dosyalarda yalnızca
+        stat yapılır.
+        
+        Returns:
+            str: Hex hash
+        """
+        if self._file_hash is None:
+            view = self._buffer()
+            if view is not None:
+                self._file_hash = hashlib.md5(view).hexdigest()
+            elif not isinstance(self.source, (str, os.PathLike)):
+                file_hash = hashlib.md5()
+                with self._open_stream() as stream:
+                    for block in iter(lambda: stream.read(1024 * 1024), b""):
+                        file_hash.update(block)
+                self._file_hash = file_hash.hexdigest()
+            elif self.cache is not None:
+                self._file_hash = self.cache.file_key(self.pdf_path)
+            else:
+                self._file_hash = ExtractionCache.hash_file(self.pdf_path)
+        return self._file_hash
+    
+    def _cache_get(self, kind=None):
+        """
+        Önbellekteki kaydı döndürür; önbellek yoksa veya okunamazsa None.
+        
+        Args:
+            kind (str, optional): Kayıt türü
+        
+        Returns:
+            dict: Kayıt veya None
+        """
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(self.file_hash(), kind=kind)
+        except Exception as e:
+            print(f"Önbellek okuma hatası ({self.pdf_path}): {e}")
+            return None
+    
+    def _cache_put(self, value, kind=None):
+        """
+        Sonucu önbelleğe yazar (önbellek tanımlıysa).
+        
+        Args:
+            value (dict): Kaydedilecek sonuç
+            kind (str, optional): Kayıt türü
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.put(self.file_hash(), value, kind=kind)
+        except Exception as e:
+            print(f"Önbellek yazma hatası ({self.pdf_path}): {e}")
+    
+    def iter_pages(self, fill_cache=True):
+        """
+        PDF sayfalarını tek tek okuyup metinlerini üreten generator.
+        Belgenin tamamı bellekte birleştirilmez; bilgi sözlüğü ilk sayfadan
+        önce self.info alanına yazılır. Okuma hatası self.error alanında saklanır.
+        Önbellekte kayıt varsa PDF hiç açılmaz; yoksa okuma eksiksiz
+        tamamlandığında sonuç önbelleğe yazılır.
+        
+        Önbelleğe yazmak için sayfalar cache_max_chars'a kadar bellekte
+        biriktirilir. Akış halinde işlenen belgelerde fill_cache=False ile
+        bu birikim kapatılır; önbellekten okuma yine yapılır.
+        
+        Sayfa veya süre sınırına takılan belgeler için o ana kadar okunan
+        sayfalar üretilir ve self.status alanı buna göre ayarlanır.
+        
+        Args:
+            fill_cache (bool): Okunan metin önbelleğe yazılsın mı
+        
+        Yields:
+            str: Sayfa metni (sonunda satır sonu ile).
+        """
+        if self._parsed is None:
+            record = self._cache_get()
+            if record is not None:
+                self._parsed = self._from_cache_record(record)
+        
+        if self._parsed is not None:
+            text = self._parsed["text"]
+            offsets = self._parsed["page_offsets"]
+            self.page_count = 0
+            self.total_pages = self._parsed["page_count"]
+            self.status = self._parsed.get("status", "complete")
+            for start, end in zip(offsets, offsets[1:] + [len(text)]):
+                if self.max_pages is not None and self.page_count >= self.max_pages:
+                    self.status = "page_limit"
+                    break
+                self.page_count += 1
+                yield text[start:end]
+            return
+        
+        self.error = None
+        self.page_count = 0
+        self.status = "complete"
+        # Önbelleğe yazmak için sayfaları yalnızca sınır aşılmadıkça biriktir
+        collected = [] if self.cache is not None and fill_cache else None
+        collected_size = 0
+        
+        if self.timeout is not None and isinstance(self.source, (str, os.PathLike)):
+            pages = self._iter_isolated_pages()
+        else:
+            pages = self._iter_local_pages()
+        
+        for page_text in pages:
+            self.page_count += 1
+            if collected is not None:
+                collected.append(page_text)
+                collected_size += len(page_text)
+                if collected_size > self.cache_max_chars:
+                    collected = None
+            yield page_text
+        
+        # Yalnızca eksiksiz okunan belgeler önbelleğe alınır
+        if collected is not None and self.status == "complete":
+            self._parsed = self._build_parsed(collected)
+            self._cache_put({
+                "text": self._parsed["text"],
+                "page_offsets": self._parsed["page_offsets"],
+                "page_count": self._parsed["page_count"],
+                "info": self._info_dict()
+            })
+    
+    def _iter_local_pages(self):
+        """
+        Sayfaları bu süreç içinde okur; sayfa sınırını ve (tanımlıysa) süre
+        sınırını sayfalar arasında uygular.
+        
+        Yields:
+            str: Sayfa metni
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        try:
+            with self._open_stream() as file:
                 reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    text += page.extract_text() + "\n"
-            return text
+                try:
+                    self.info = reader.metadata
+                except Exception as e:
+                    print(f"Metadata okuma hatası ({self.pdf_path}): {e}")
+                
+                self.total_pages = len(reader.pages)
+                for index, page in enumerate(reader.pages):
+                    if self.max_pages is not None and index >= self.max_pages:
+                        self.status = "page_limit"
+                        break
+                    if deadline is not None and time.monotonic() > deadline:
+                        print(f"PDF metin çıkarma süresi aşıldı ({self.pdf_path}), {index} sayfa okundu")
+                        self.status = "timeout"
+                        break
+                    yield page.extract_text() + "\n"
         except Exception as e:
             print(f"PDF metin çıkarma hatası ({self.pdf_path}): {e}")
-            return ""
+            self.error = e
+            self.status = "failed"
+    
+    def _iter_isolated_pages(self):
+        """
+        Dosya kaynağının sayfalarını ayrı bir süreçte okuyup boru üzerinden
+        alır; işçi dosyayı kendisi açar, içerik süreçler arasında kopyalanmaz.
+        Süre sınırı yalnızca işçiyi beklerken geçen zamana uygulanır; sınır
+        aşılırsa veya tüketici erken durursa işçi süreç sonlandırılır.
+        
+        Yields:
+            str: Sayfa metni
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(
+            target=_isolated_page_worker,
+            args=(sender, self.pdf_path, self.max_pages),
+            daemon=True
+        )
+        worker.start()
+        sender.close()
+        
+        remaining = self.timeout
+        try:
+            while True:
+                started = time.monotonic()
+                if remaining <= 0 or not receiver.poll(remaining):
+                    print(f"PDF metin çıkarma süresi aşıldı ({self.pdf_path}), {self.page_count} sayfa okundu")
+                    self.status = "timeout"
+                    break
+                remaining -= time.monotonic() - started
+                
+                kind, value = receiver.recv()
+                if kind == "info":
+                    self.info = value
+                elif kind == "total_pages":
+                    self.total_pages = value
+                elif kind == "page":
+                    yield value
+                elif kind == "done":
+                    self.status = value
+                    break
+                elif kind == "error":
+                    raise RuntimeError(value)
+        except (EOFError, RuntimeError) as e:
+            print(f"PDF metin çıkarma hatası ({self.pdf_path}): {e}")
+            self.error = e
+            self.status = "failed"
+        finally:
+            receiver.close()
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+    
+    def iter_clean_pages(self, count_tokens=None, fill_cache=True):
+        """
+        iter_pages ile aynı, ancak sayfalar PageCleaner'dan geçirilir:
+        bölünmüş kelimeler birleştirilir, üst/alt bilgiler ile kaynakça ve
+        teşekkür bölümleri atlanır. İstatistikler self.cleanup_stats alanındadır.
+        
+        Args:
+            count_tokens (callable, optional): Atılan metnin token sayısını
+                hesaplamak için sayaç
+            fill_cache (bool): Okunan metin önbelleğe yazılsın mı (bkz. iter_pages)
+        
+        Yields:
+            str: Temizlenmiş sayfa metni.
+        """
+        cleaner = PageCleaner(count_tokens=count_tokens)
+        self.cleanup_stats = cleaner.stats
+        yield from cleaner.clean(self.iter_pages(fill_cache=fill_cache))
+    
+    def parse(self):
+        """
+        PDF dosyasını tek seferde açıp işler. Metin, metadata, sayfa sayısı ve
+        sayfa başlangıç ofsetleri aynı okumadan üretilir; sonuç nesnede
+        saklandığı için tekrar çağrıldığında dosya yeniden okunmaz.
+        
+        Returns:
+            dict: "text", "metadata", "page_count", "page_offsets" ve "status"
+                alanları. Sayfa veya süre sınırına takılan belgelerde metin
+                kısmidir ve "status" bunu belirtir.
+        """
+        if self._parsed is not None:
+            return self._parsed
+        
+        pages = list(self.iter_pages())
+        if self._parsed is not None:
+            # iter_pages önbellekten okudu veya sonucu zaten oluşturdu
+            return self._parsed
+        
+        # Yarıda kalan okumada eski davranışla uyumlu olarak boş metin döndür
+        if self.error is not None:
+            pages = []
+        
+        self._parsed = self._build_parsed(pages)
+        return self._parsed
+    
+    def _build_parsed(self, pages):
+        """
+        Sayfa metinlerinden parse() sonucunu oluşturur.
+        
+        Args:
+            pages (list): Sayfa metinleri
+        
+        Returns:
+            dict: "text", "metadata", "page_count" ve "page_offsets" alanları.
+        """
+        page_offsets = []
+        offset = 0
+        for page_text in pages:
+            page_offsets.append(offset)
+            offset += len(page_text)
+        
+        return {
+            "text": "".join(pages),
+            "metadata": self.build_metadata(pages[0] if pages else ""),
+            "page_count": len(page_offsets),
+            "page_offsets": page_offsets,
+            "status": self.status or "complete"
+        }
+    
+    def _info_dict(self):
+        """
+        Bilgi sözlüğünün metadata için kullanılan alanlarını JSON'a
+        çevrilebilir halde döndürür.
+        
+        Returns:
+            dict: "/Title", "/Author" ve "/CreationDate" alanları
+        """
+        info = {}
+        if self.info:
+            for key in ('/Title', '/Author', '/CreationDate'):
+                value = self.info.get(key)
+                if value:
+                    info[key] = str(value)
+        return info
+    
+    def _from_cache_record(self, record):
+        """
+        Önbellek kaydından parse() sonucunu oluşturur. Önbellek içerik adresli
+        olduğundan dosya adına bağlı alanlar (başlık yedeği, arXiv ID)
+        kayıttan değil bu işleyicinin adından yeniden üretilir.
+        
+        Args:
+            record (dict): Önbellek kaydı
+        
+        Returns:
+            dict: "text", "metadata", "page_count" ve "page_offsets" alanları.
+        """
+        self.info = record["info"]
+        text = record["text"]
+        offsets = record["page_offsets"]
+        first_page = text[:offsets[1]] if len(offsets) > 1 else text
+        return {
+            "text": text,
+            "metadata": self.build_metadata(first_page),
+            "page_count": record["page_count"],
+            "page_offsets": offsets,
+            "status": "complete"
+        }
+    
+    def extract_text(self):
+        """
+        PDF dosyasından metin çıkarır.
+        
+        Returns:
+            str: Çıkarılan metin, başarısızsa boş string.
+        """
+        return self.parse()["text"]
     
-    def extract_metadata(self):
+    def extract_metadata(self, fast=False, timeout=None):
         """
         PDF dosyasından metadata çıkarmaya çalışır.
         
+        Args:
+            fast (bool): True ise tam metin çıkarılmaz; yalnızca bilgi sözlüğü
+                ve (yazar bilgisi yoksa) ilk sayfa okunur. Listeleme gibi
+                metne ihtiyaç duyulmayan durumlar için.
+            timeout (float, optional): Hızlı modda okuma için süre sınırı
+                (saniye). Dosya kaynaklarında okuma, süre dolunca sonlandırılan
+                ayrı bir süreçte yapılır; aşılırsa dosya adıyla üretilen
+                metadata döndürülür. Süresi aşılan okuma önbelleğe yazılmaz,
+                ancak aynı dosya metadata_retry_after saniye boyunca yeniden
+                denenmez.
+        
         Returns:
             dict: Metadata bilgileri.
         """
+        if not fast or self._parsed is not None:
+            return self.parse()["metadata"]
+        
+        cached = self._cache_get(kind="metadata")
+        if cached is not None:
+            self.info = cached["info"]
+            return self.build_metadata(cached["first_page"])
+        
+        if timeout is None or not isinstance(self.source, (str, os.PathLike)):
+            head = {}
+            self._read_head(head)
+            self.info = head.get("info")
+            record = {"info": self._info_dict(), "first_page": head.get("first_page", "")}
+        else:
+            # PyPDF2 bozuk dosyalarda takılabilir; süre dolunca sonlandırılabilen bir süreçte oku
+            key = self.file_hash()
+            record = None
+            if time.monotonic() >= PDFProcessor._metadata_timeouts.get(key, 0):
+                record = self._read_head_isolated(timeout)
+            if record is None:
+                # Geçici yavaşlık kalıcı bir dosya adı başlığı olarak saklanmasın
+                print(f"Metadata okuma süresi aşıldı ({self.pdf_path})")
+                PDFProcessor._metadata_timeouts[key] = time.monotonic() + self.metadata_retry_after
+                self.info = {}
+                return self.build_metadata("")
+            PDFProcessor._metadata_timeouts.pop(key, None)
+            self.info = record["info"]
+        
+        self._cache_put(record, kind="metadata")
+        return self.build_metadata(record["first_page"])
+    
+    def _read_head_isolated(self, timeout):
+        """
+        Bilgi sözlüğünü ve ilk sayfayı ayrı bir süreçte okur; süre dolarsa
+        süreç sonlandırılır.
+        
+        Args:
+            timeout (float): Süre sınırı (saniye)
+        
+        Returns:
+            dict: "info" ve "first_page" alanları; süre aşılırsa veya süreç
+                sonuç göndermeden biterse None
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(
+            target=_isolated_head_worker,
+            args=(sender, self.pdf_path),
+            daemon=True
+        )
+        worker.start()
+        sender.close()
         try:
-            metadata = {}
-            
-            # PDF'den bilgileri çıkar
-            with open(self.pdf_path, 'rb') as file:
+            if receiver.poll(timeout):
+                return receiver.recv()
+            return None
+        except EOFError:
+            return None
+        finally:
+            receiver.close()
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+    
+    def _read_head(self, head):
+        """
+        Yalnızca bilgi sözlüğünü ve gerekirse ilk sayfanın metnini okur.
+        
+        Args:
+            head (dict): "info" ve "first_page" alanları yazılır
+        """
+        try:
+            with self._open_stream() as file:
                 reader = PyPDF2.PdfReader(file)
                 info = reader.metadata
+                head["info"] = info
                 
-                if info:
-                    metadata["title"] = info.get('/Title', None)
-                    metadata["authors"] = info.get('/Author', None)
-                    metadata["created"] = info.get('/CreationDate', None)
+                # Yazar bilgisi varsa ilk sayfayı okumaya gerek yok
+                if not (info and info.get('/Author')) and len(reader.pages) > 0:
+                    head["first_page"] = reader.pages[0].extract_text() + "\n"
+        except Exception as e:
+            print(f"Metadata okuma hatası ({self.pdf_path}): {e}")
+    
+    def build_metadata(self, first_page_text):
+        """
+        PDF bilgi sözlüğü ve ilk sayfa metninden metadata oluşturur.
+        iter_pages() ile akış halinde okunurken ilk sayfa geldikten sonra
+        çağrılabilir.
+        
+        Args:
+            first_page_text (str): İlk sayfanın metni (yazar tahmini için)
+        
+        Returns:
+            dict: Metadata bilgileri.
+        """
+        if self._parsed is not None:
+            return dict(self._parsed["metadata"])
+        
+        info = self.info
+        try:
+            metadata = {}
+            
+            if info:
+                metadata["title"] = info.get('/Title', None)
+                metadata["authors"] = info.get('/Author', None)
+                metadata["created"] = info.get('/CreationDate', None)
             
             # Başlık bulunamadıysa dosya adını kullan
             if not metadata.get("title"):
@@ -58,23 +784,21 @@ class PDFProcessor:
                 metadata["title"] = file_name.replace(".pdf", "")
             
             # İlk sayfadan içerik çıkar ve başlık/yazar tahmin et
-            if not metadata.get("authors"):
-                text = self.extract_text()
-                if text:
-                    first_page = text.split('\n\n')[:10]
-                    joined_first_page = "\n".join(first_page)
-                    
-                    # Yazar bilgisini ara (bazı genel kalıplar)
-                    author_patterns = [
-                        r"(?:Author|Authors|By)[s]?:?\s*(.*?)(?:\n|$)",
-                        r"^(.*?)\n.*?(?:University|Institute|College|Laboratory|Department)",
-                    ]
-                    
-                    for pattern in author_patterns:
-                        author_match = re.search(pattern, joined_first_page, re.IGNORECASE | re.MULTILINE)
-                        if author_match:
-                            metadata["authors"] = author_match.group(1).strip()
-                            break
+            if not metadata.get("authors") and first_page_text:
+                first_page = first_page_text.split('\n\n')[:10]
+                joined_first_page = "\n".join(first_page)
+                
+                # Yazar bilgisini ara (bazı genel kalıplar)
+                author_patterns = [
+                    r"(?:Author|Authors|By)[s]?:?\s*(.*?)(?:\n|$)",
+                    r"^(.*?)\n.*?(?:University|Institute|College|Laboratory|Department)",
+                ]
+                
+                for pattern in author_patterns:
+                    author_match = re.search(pattern, joined_first_page, re.IGNORECASE | re.MULTILINE)
+                    if author_match:
+                        metadata["authors"] = author_match.group(1).strip()
+                        break
             
             # Tarih bilgisi yoksa şimdiyi kullan
             if not metadata.get("created"):
@@ -126,4 +850,56 @@ class PDFProcessor:
                 "file_size": 0,
                 "created": "",
                 "modified": ""
-            }
\ No newline at end of file
+            }
+
+
+def _isolated_page_worker(sender, source, max_pages):
+    """
+    Ayrı süreçte çalışır: PDF sayfalarını okuyup boru üzerinden gönderir.
+    
+    Args:
+        sender: multiprocessing bağlantısı
+        source: PDF dosya yolu
+        max_pages (int): Okunacak en fazla sayfa sayısı (None: sınırsız)
+    """
+    processor = PDFProcessor(source)
+    try:
+        with processor._open_stream() as file:
+            reader = PyPDF2.PdfReader(file)
+            try:
+                processor.info = reader.metadata
+            except Exception as e:
+                print(f"Metadata okuma hatası ({processor.pdf_path}): {e}")
+            sender.send(("info", processor._info_dict()))
+            sender.send(("total_pages", len(reader.pages)))
+            
+            status = "complete"
+            for index, page in enumerate(reader.pages):
+                if max_pages is not None and index >= max_pages:
+                    status = "page_limit"
+                    break
+                sender.send(("page", page.extract_text() + "\n"))
+        sender.send(("done", status))
+    except Exception as e:
+        sender.send(("error", str(e)))
+    finally:
+        sender.close()
+
+
+def _isolated_head_worker(sender, source):
+    """
+    Ayrı süreçte çalışır: bilgi sözlüğünü ve gerekirse ilk sayfayı okuyup
+    boru üzerinden gönderir.
+    
+    Args:
+        sender: multiprocessing bağlantısı
+        source: PDF dosya yolu
+    """
+    processor = PDFProcessor(source)
+    try:
+        head = {}
+        processor._read_head(head)
+        processor.info = head.get("info")
+        sender.send({"info": processor._info_dict(), "first_page": head.get("first_page", "")})
+    finally:
+        sender.close()
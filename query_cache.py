@@ -0,0 +1,105 @@
+import copy
+import json
+import time
+import threading
+from collections import OrderedDict
+
+class QueryCache:
+    def __init__(self, max_entries=256, ttl=300):
+        """
+        Arama sonuçları için süreç içi önbellek (LRU + TTL).
+        
+        Kayıtlar sorgu metni, sonuç sayısı ve normalize edilmiş filtre ile
+        saklanır. Koleksiyona her yazma ve silmede nesil sayacı artırılır
+        (bkz. bump); önceki nesilde saklanmış sonuçlar bir daha döndürülmez.
+        
+        Args:
+            max_entries (int): En fazla kayıt sayısı, aşılınca en uzun süredir
+                kullanılmayan kayıt atılır
+            ttl (float): Kaydın geçerlilik süresi (saniye)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(*parts):
+        """
+        Sorgu parametrelerinden kayıt anahtarını oluşturur. Sözlükler anahtar
+        sırasından bağımsız olarak aynı anahtarı verir.
+        
+        Args:
+            *parts: JSON'a çevrilebilen sorgu parametreleri
+        
+        Returns:
+            str: Anahtar
+        """
+        return json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def get(self, key):
+        """
+        Kayıtlı sonucu döndürür.
+        
+        Args:
+            key (str): Kayıt anahtarı
+        
+        Returns:
+            tuple: (sonuç veya None, nesil); sonuç kaydedilirken bu nesil
+                put'a verilmelidir
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expires, value = entry
+                if generation == self.generation and expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value), self.generation
+                del self._entries[key]
+            self.misses += 1
+            return None, self.generation
+    
+    def put(self, key, value, generation):
+        """
+        Sonucu kaydeder. Sonuç hesaplanırken koleksiyon değiştiyse (nesil
+        ilerlediyse) kaydedilmez.
+        
+        Args:
+            key (str): Kayıt anahtarı
+            value: Sonuç
+            generation (int): Sonucun hesaplandığı nesil (get'in döndürdüğü)
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (generation, time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def bump(self):
+        """
+        Koleksiyon değiştiğinde çağrılır; tüm kayıtları geçersiz kılar.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+    
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür.
+        
+        Returns:
+            dict: hits, misses, entries ve generation alanları
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "generation": self.generation
+            }
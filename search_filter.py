@@ -0,0 +1,180 @@
+import re
+from datetime import date, datetime, timezone
+
+def category_field(category):
+    """
+    Kategorinin parça metadata'sındaki alan adını döndürür. Chroma liste
+    değerlerini kabul etmediğinden her kategori ayrı bir mantıksal alandır
+    ("cs.LG" -> "cat_cs_LG").
+    
+    Args:
+        category (str): arXiv kategorisi
+    
+    Returns:
+        str: Alan adı
+    """
+    return "cat_" + re.sub(r"\W", "_", category.strip())
+
+
+def published_epoch(value):
+    """
+    Yayın tarihini Unix zamanına (UTC gece yarısı) çevirir.
+    
+    Args:
+        value: "YYYY-MM-DD" ile başlayan metin, date, datetime veya Unix zamanı
+    
+    Returns:
+        int: Unix zamanı; değer yoksa veya okunamazsa None
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        if isinstance(value, str):
+            value = datetime.strptime(value[:10], "%Y-%m-%d")
+        elif not isinstance(value, datetime) and isinstance(value, date):
+            value = datetime(value.year, value.month, value.day)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class SearchFilter:
+    def __init__(self):
+        """
+        Arama filtresi oluşturucu. Koşullar zincirleme eklenir ve build ile
+        Chroma'nın where ifadesine çevrilir; filtreleme sonuçlar geldikten
+        sonra değil, dizinde arama sırasında yapılır. Farklı çağrılarla
+        eklenen koşulların hepsi sağlanmalıdır.
+        
+        Örnek:
+            SearchFilter().years(2021, 2023).categories("cs.LG", "stat.ML")
+        """
+        self.conditions = []
+    
+    @staticmethod
+    def _any(field, values):
+        """
+        Alanın verilen değerlerden birine eşit olması koşulu.
+        
+        Args:
+            field (str): Metadata alanı
+            values (list): Değerler
+        
+        Returns:
+            dict: Koşul
+        """
+        values = list(values)
+        if len(values) == 1:
+            return {field: values[0]}
+        return {field: {"$in": values}}
+    
+    def years(self, start=None, end=None):
+        """
+        Yayın yılını sınırlar (sınırlar dahil).
+        
+        Args:
+            start (int, optional): En erken yıl
+            end (int, optional): En geç yıl
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        if start is not None:
+            self.conditions.append({"year": {"$gte": int(start)}})
+        if end is not None:
+            self.conditions.append({"year": {"$lte": int(end)}})
+        return self
+    
+    def published(self, after=None, before=None):
+        """
+        Yayın tarihini sınırlar (sınırlar dahil).
+        
+        Args:
+            after (optional): En erken tarih (bkz. published_epoch)
+            before (optional): En geç tarih
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        if published_epoch(after) is not None:
+            self.conditions.append({"published": {"$gte": published_epoch(after)}})
+        if published_epoch(before) is not None:
+            self.conditions.append({"published": {"$lte": published_epoch(before)}})
+        return self
+    
+    def categories(self, *categories):
+        """
+        Verilen kategorilerden en az birinde olan belgeleri seçer.
+        
+        Args:
+            *categories (str): arXiv kategorileri ("cs.LG" gibi)
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        conditions = [{category_field(category): True} for category in categories if category.strip()]
+        if len(conditions) == 1:
+            self.conditions.append(conditions[0])
+        elif conditions:
+            self.conditions.append({"$or": conditions})
+        return self
+    
+    def arxiv_ids(self, *arxiv_ids):
+        """
+        Belgeleri arXiv ID'sine göre seçer; sürüm eki yok sayılır.
+        
+        Args:
+            *arxiv_ids (str): arXiv ID'leri
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        if arxiv_ids:
+            bases = list(dict.fromkeys(re.sub(r"v\d+$", "", arxiv_id.strip()) for arxiv_id in arxiv_ids))
+            self.conditions.append(self._any("arxiv_base", bases))
+        return self
+    
+    def sources(self, *sources):
+        """
+        Belgeleri kaynağa göre seçer ("arxiv", "manual_upload" gibi).
+        
+        Args:
+            *sources (str): Kaynaklar
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        if sources:
+            self.conditions.append(self._any("source", sources))
+        return self
+    
+    def where(self, clause):
+        """
+        Hazır bir Chroma where ifadesini koşul olarak ekler.
+        
+        Args:
+            clause (dict): where ifadesi
+        
+        Returns:
+            SearchFilter: Zincirleme için kendisi
+        """
+        if clause:
+            self.conditions.append(clause)
+        return self
+    
+    def build(self):
+        """
+        Koşulları tek bir where ifadesinde birleştirir.
+        
+        Returns:
+            dict: where ifadesi; koşul yoksa None
+        """
+        if not self.conditions:
+            return None
+        if len(self.conditions) == 1:
+            return self.conditions[0]
+        return {"$and": list(self.conditions)}
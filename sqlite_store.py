@@ -0,0 +1,126 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+def database_file(directory, file_name):
+    """
+    Veritabanı dosyasının yolunu döndürür, dizin yoksa oluşturur.
+    
+    Args:
+        directory (str): Veritabanı dizini
+        file_name (str): Dosya adı
+    
+    Returns:
+        str: Dosya yolu
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    return os.path.join(directory, file_name)
+
+
+@contextmanager
+def connect(db_file):
+    """
+    Her işlem için yeni bir bağlantı açar, işlem sonunda commit edip kapatır.
+    WAL kipi sayesinde süreç havuzundaki işçiler ve Streamlit oturumları aynı
+    dosyayı güvenle kullanabilir.
+    
+    Args:
+        db_file (str): Veritabanı dosyası
+    
+    Yields:
+        sqlite3.Connection: Bağlantı.
+    """
+    conn = sqlite3.connect(db_file, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def track_size(conn, table):
+    """
+    Tablonun kayıt sayısını ve "size" sütununun toplamını table_sizes
+    tablosunda tutar. Toplamlar ekleme, silme ve boyut güncellemesinde
+    tetikleyicilerle güncellenir; tablo yalnızca toplamlar ilk kez
+    oluşturulurken taranır. Kayıtlar INSERT OR REPLACE yerine ON CONFLICT
+    DO UPDATE ile güncellenmelidir (REPLACE silme tetikleyicisini çalıştırmaz).
+    
+    Args:
+        conn (sqlite3.Connection): Açık bağlantı
+        table (str): Tablo adı ("size" sütunu olmalı)
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS table_sizes (
+            name TEXT PRIMARY KEY,
+            entries INTEGER NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """)
+    if conn.execute("SELECT 1 FROM table_sizes WHERE name = ?", (table,)).fetchone() is None:
+        conn.execute(
+            f"INSERT INTO table_sizes SELECT ?, COUNT(*), COALESCE(SUM(size), 0) FROM {table}",
+            (table,)
+        )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_size_insert AFTER INSERT ON {table} BEGIN
+            UPDATE table_sizes SET entries = entries + 1, size = size + NEW.size WHERE name = '{table}';
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_size_delete AFTER DELETE ON {table} BEGIN
+            UPDATE table_sizes SET entries = entries - 1, size = size - OLD.size WHERE name = '{table}';
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_size_update AFTER UPDATE OF size ON {table} BEGIN
+            UPDATE table_sizes SET size = size + NEW.size - OLD.size WHERE name = '{table}';
+        END
+    """)
+
+
+def table_size(conn, table):
+    """
+    track_size ile izlenen tablonun toplamlarını okur; tablo taranmaz.
+    
+    Args:
+        conn (sqlite3.Connection): Açık bağlantı
+        table (str): Tablo adı
+    
+    Returns:
+        tuple: (kayıt sayısı, toplam boyut)
+    """
+    row = conn.execute("SELECT entries, size FROM table_sizes WHERE name = ?", (table,)).fetchone()
+    return tuple(row) if row else (0, 0)
+
+
+def evict_lru(conn, table, key_column, max_bytes):
+    """
+    Toplam boyut sınırın altına inene kadar en uzun süredir kullanılmayan
+    kayıtları siler. Toplam track_size'ın tuttuğu değerden okunur; sınır
+    aşılmadıkça tablo taranmaz.
+    
+    Args:
+        conn (sqlite3.Connection): Açık bağlantı
+        table (str): Tablo adı ("size" ve "last_access" sütunları olmalı)
+        key_column (str): Birincil anahtar sütunu
+        max_bytes (int): Toplam boyut sınırı
+    
+    Returns:
+        list: Silinen kayıtların anahtarları
+    """
+    _, total = table_size(conn, table)
+    if total <= max_bytes:
+        return []
+    
+    evicted = []
+    for key, size in conn.execute(f"SELECT {key_column}, size FROM {table} ORDER BY last_access"):
+        if total <= max_bytes:
+            break
+        evicted.append(key)
+        total -= size
+    
+    conn.executemany(f"DELETE FROM {table} WHERE {key_column} = ?", [(key,) for key in evicted])
+    return evicted